@@ -65,6 +65,7 @@ def _run_editor(_: argparse.Namespace) -> None:
     from game.core.app import App
     from game.core.config import load_window_config
     from game.main import _share_path
+    from game.scenes import SCENE_SPECS, load_scene
     from game.scenes.editor import EditorScene
     import sys  # Import sys for sys.exit
 
@@ -72,8 +73,8 @@ def _run_editor(_: argparse.Namespace) -> None:
     app = App(cfg)
 
     editor_scene_index = -1
-    for i, scene_cls in enumerate(app.scenes):
-        if scene_cls is EditorScene:
+    for i, scene_id in enumerate(SCENE_SPECS):
+        if load_scene(scene_id) is EditorScene:
             editor_scene_index = i
             break
     if editor_scene_index != -1:
@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict, deque
+from functools import lru_cache
 import os
 from pathlib import Path
 from time import perf_counter
-from typing import NamedTuple, Type
+from typing import Callable, NamedTuple, Type
 
 import pygame
 
 from game.core.audio import AudioManager
 from game.core.clock import GameClock
 from game.core.config import WindowConfig
-from game.scenes import MainScene, EditorScene, Scene
+from game.core.resources import set_disk_cache_enabled
+from game.scenes import SCENE_SPECS, Scene, load_scene
 
 from rich.console import Console
 from rich.panel import Panel
 
 console = Console()
 
+# Rich panels are opt-in; plain prints keep the profiling output cheap.
+_PRETTY_LOG = bool(os.environ.get("GAME_PRETTY_LOG"))
+
+
+def _log(msg: str, border_style: str = "white", title: str | None = None) -> None:
+    if _PRETTY_LOG:
+        console.print(Panel.fit(msg, title=title, border_style=border_style))
+    elif title:
+        print(f"[{title}]\n{msg}")
+    else:
+        print(msg)
+
 
 class HudLine(NamedTuple):
     text: str
@@ -25,16 +39,42 @@ class HudLine(NamedTuple):
     align: str = "left"  # "left" | "center" | "right"
 
 
-def _build_scenes() -> dict[str, Type[Scene]]:
-    # SCENES: dict[str, Type[Scene]]
-    import game.scenes as scenes_for_app
+def _poll_events() -> list[pygame.event.Event]:
+    # One pump per frame, then drain the whole queue without re-pumping.
+    pygame.event.pump()
+    return pygame.event.get(pump=False)
+
+
+# Event types nothing in the game consumes; SDL drops them before they
+# reach the Python queue.
+_BLOCKED_EVENT_TYPES: tuple[int, ...] = tuple(
+    getattr(pygame, name)
+    for name in ("FINGERMOTION", "FINGERDOWN", "FINGERUP", "MULTIGESTURE", "TEXTEDITING")
+    if hasattr(pygame, name)
+)
+
+
+@lru_cache(maxsize=512)
+def _key_label(key: int) -> str:
+    return f"Key {pygame.key.name(key)}"
+
 
-    return scenes_for_app.SCENES
+# Joystick buttons 12 + 14 held together cycle the HUD mode.
+_HUD_COMBO_MASK = (1 << 12) | (1 << 14)
+# Every joystick button the App itself reacts to (combo + scene switching).
+_APP_JOY_BUTTONS = frozenset({12, 14, 15, 16})
+
+# Scene table resolved once at import: ((scene_id, class name), ...).
+# The scene modules themselves are imported lazily by set_scene().
+_SCENE_TABLE: tuple[tuple[str, str], ...] = tuple(
+    (scene_id, class_name) for scene_id, (_, class_name) in SCENE_SPECS.items()
+)
 
 
 class App:
     def __init__(self, config: WindowConfig) -> None:
         self.cfg = config
+        set_disk_cache_enabled(self.cfg.image_disk_cache)
 
         if self.cfg.window_pos is not None:
             x, y = self.cfg.window_pos
@@ -42,6 +82,8 @@ class App:
 
         pygame.init()
         pygame.joystick.init()
+        if _BLOCKED_EVENT_TYPES:
+            pygame.event.set_blocked(list(_BLOCKED_EVENT_TYPES))
 
         self.joysticks: list[pygame.joystick.Joystick] = []
         for i in range(pygame.joystick.get_count()):
@@ -49,7 +91,8 @@ class App:
             js.init()
             self.joysticks.append(js)
 
-        self.joy_buttons_down: set[int] = set()
+        # Bit N set while joystick button N is held.
+        self.joy_buttons_mask = 0
 
         pygame.display.set_caption(self.cfg.title)
         self.screen_flags = 0
@@ -58,17 +101,25 @@ class App:
         elif self.cfg.resizable:
             self.screen_flags |= pygame.RESIZABLE
 
-        window_size = (0, 0) if self.cfg.fullscreen else (self.cfg.width, self.cfg.height)
-        if self.cfg.display_index is None:
-            self.screen = pygame.display.set_mode(window_size, self.screen_flags)
+        mode_kwargs: dict[str, int] = {}
+        if self.cfg.scaled:
+            # GPU-scaled presentation keeps the logical size even in fullscreen.
+            self.screen_flags |= pygame.SCALED | pygame.DOUBLEBUF
+            mode_kwargs["vsync"] = 1
+            window_size = (self.cfg.width, self.cfg.height)
         else:
-            self.screen = pygame.display.set_mode(
-                window_size,
-                self.screen_flags,
-                display=int(self.cfg.display_index),
+            window_size = (
+                (0, 0) if self.cfg.fullscreen else (self.cfg.width, self.cfg.height)
             )
+        if self.cfg.display_index is not None:
+            mode_kwargs["display"] = int(self.cfg.display_index)
+        self.screen = pygame.display.set_mode(
+            window_size, self.screen_flags, **mode_kwargs
+        )
+        # Full-screen viewport, rebuilt only on VIDEORESIZE.
+        self._viewport_rect = self.screen.get_rect()
 
-        self.clock = GameClock(self.cfg.fps)
+        self.clock = GameClock(self.cfg.fps, busy_loop=self.cfg.low_latency)
 
         self.audio = AudioManager()
         self.audio.init()
@@ -76,71 +127,108 @@ class App:
         self.running = True
 
         # --- Scenes ------------------------------------------------------
-        self.scenes: dict[str, Type[Scene]] = _build_scenes()
-        self._scene_ids: list[str] = list(self.scenes.keys())
+        # Scene classes, filled in as each scene is first entered.
+        self.scenes: dict[str, Type[Scene]] = {}
+        self._scene_ids: list[str] = [scene_id for scene_id, _ in _SCENE_TABLE]
+        self._n_scenes = len(self._scene_ids)
+        self._scene_names: tuple[str, ...] = tuple(name for _, name in _SCENE_TABLE)
+        if self._n_scenes == 0:
+            raise RuntimeError("[App] No scenes registered")
 
         # Numeric index for cycling
         self._scene_index: int = 0
-        if "main" in self.scenes:
+        if "main" in self._scene_ids:
             self._scene_index = self._scene_ids.index("main")
 
         self.scene: Scene | None = None
 
-        console.print(Panel.fit("✅ Pygame initialized", border_style="green"))
-        console.print(
-            Panel.fit("F1/F2 or TAB/SHIFT+TAB: switch scene", border_style="cyan")
-        )
+        # Global hotkeys; anything else is forwarded to the scene.
+        self._key_handlers: dict[int, Callable[[pygame.event.Event], None]] = {
+            pygame.K_p: lambda ev: self.toggle_profiling(),
+            pygame.K_h: lambda ev: self.toggle_hud(),
+            pygame.K_F1: lambda ev: self.prev_scene(),
+            pygame.K_F2: lambda ev: self.next_scene(),
+            pygame.K_TAB: lambda ev: (
+                self.prev_scene() if ev.mod & pygame.KMOD_SHIFT else self.next_scene()
+            ),
+        }
+        self._joy_button_handlers: dict[int, Callable[[], None]] = {
+            15: self.prev_scene,
+            16: self.next_scene,
+        }
+        self._scene_label = "None"
+
+        _log("✅ Pygame initialized", border_style="green")
+        _log("F1/F2 or TAB/SHIFT+TAB: switch scene", border_style="cyan")
 
         # HUD
         self.hud_font = pygame.font.Font(None, 33)
+        self._hud_font_h = self.hud_font.get_height()
         self.hud_visible = True
         self.hud_height = 20
         self.hud_alpha = 75
         self._hud_last_input = "-"
         self._hud_recent_inputs: deque[str] = deque(maxlen=5)
-
-        self._avg_timings: dict[str, float] = {
-            "events": 0.0,
-            "update": 0.0,
-            "render": 0.0,
+        self._hud_recent_str = ""
+        # (pads, joy_buttons_mask) -> text; dropped whenever the labels change.
+        self._input_status_cache: tuple[tuple[int, int], str] | None = None
+        self._input_label_fns: dict[int, Callable[[pygame.event.Event], str]] = {
+            pygame.KEYDOWN: lambda ev: _key_label(ev.key),
+            pygame.MOUSEBUTTONDOWN: lambda ev: f"Mouse {ev.button}",
+            pygame.MOUSEWHEEL: lambda ev: "Mouse wheel",
+            pygame.JOYBUTTONDOWN: lambda ev: f"Joy{ev.joy} Btn{ev.button}",
+            pygame.JOYAXISMOTION: lambda ev: f"Joy{ev.joy} Axis{ev.axis}:{ev.value:0.2f}",
+            pygame.JOYHATMOTION: lambda ev: f"Joy{ev.joy} Hat{ev.hat} {ev.value}",
         }
+
+        self._avg_events_ms = 0.0
+        self._avg_update_ms = 0.0
+        self._avg_render_ms = 0.0
         self._avg_fps = 0.0
         self._avg_dt_ms = 0.0
         self._hud_stats_alpha = 0.12
+        self._hud_stats_keep = 1.0 - self._hud_stats_alpha
 
         self._toast_text: str | None = None
         self._toast_t = 0.0
 
+        self._frame_no = 0
+        self._mixer_channels: list[pygame.mixer.Channel] = []
+        self._audio_status_cache: tuple[int, str] | None = None
+        self._audio_status_interval = 10  # frames
+
         # Render target cache
         self._scene_surf: pygame.Surface | None = None
         self._scene_surf_size: tuple[int, int] | None = None
 
-        self._timings: dict[str, float] = {"events": 0.0, "update": 0.0, "render": 0.0}
+        self._events_ms = 0.0
+        self._update_ms = 0.0
+        self._render_ms = 0.0
         self._hud_show_timings = False
-        self._hud_text_cache: dict[str, tuple[str, pygame.Surface]] = {}
-
+        self._hud_text_cache: OrderedDict[
+            tuple[str, tuple[int, int, int]], pygame.Surface
+        ] = OrderedDict()
+        self._hud_text_cache_size = 128
+
+        # HUD overlay is rebuilt only when marked dirty (input, scene, toast)
+        # or every `_hud_refresh_interval` frames for the live stats.
+        self._hud_dirty = True
+        self._hud_refresh_interval = 15  # frames
+        self._hud_composite_surf: pygame.Surface | None = None
         self._hud_bar_surface: pygame.Surface | None = None
-        self._hud_bar_size: tuple[int, int] | None = None
-        self._hud_bar_alpha: int | None = None
+        self._hud_bar_key: tuple[tuple[int, int], int] | None = None
 
         self._profiling_mode = False
         self._profiling_frame_window = 60
         self._profiling_frames = 0
-        self._profiling_accumulator: dict[str, float] = {
-            "events": 0.0,
-            "update": 0.0,
-            "render": 0.0,
-        }
+        # Per-window sums of the frame phase timings (ms).
+        self._prof_events_sum = 0.0
+        self._prof_update_sum = 0.0
+        self._prof_render_sum = 0.0
 
     # --- Scene switching -------------------------------------------------
-    def _wrap_index(self, index: int) -> int:
-        return 0 if not self._scene_ids else index % len(self._scene_ids)
-
     def set_scene(self, index: int, composition_path: str | Path | None = None) -> None:
-        if not self._scene_ids:
-            return
-
-        new_index = self._wrap_index(index)
+        new_index = index % self._n_scenes
         if new_index == self._scene_index and self.scene is not None:
             return
 
@@ -149,25 +237,30 @@ class App:
 
         self._scene_index = new_index
         scene_id = self._scene_ids[self._scene_index]
-        scene_cls = self.scenes[scene_id]
+        scene_cls = self.scenes.get(scene_id)
+        if scene_cls is None:
+            scene_cls = self.scenes[scene_id] = load_scene(scene_id)
+        scene_name = self._scene_names[self._scene_index]
         # Caso especial: MainScene recibe composition_path
-        if getattr(scene_cls, "__name__", "") == "MainScene":
+        if scene_name == "MainScene":
             self.scene = scene_cls(composition_path=composition_path)  # type: ignore[call-arg]
         else:
             self.scene = scene_cls()
 
         self.scene.on_enter(self)
+        self._scene_label = (
+            f"{scene_name}  [{scene_id} {self._scene_index + 1}/{self._n_scenes}]"
+        )
 
         self._toast_text = (
-            f"{scene_id}  ({self._scene_index + 1}/{len(self._scene_ids)})"
+            f"{scene_id}  ({self._scene_index + 1}/{self._n_scenes})"
         )
         self._toast_t = 1.2
+        self._hud_dirty = True
 
-        console.print(
-            Panel.fit(
-                f"🎬 Scene -> {scene_id} ({self._scene_index + 1}/{len(self._scene_ids)})",
-                border_style="magenta",
-            )
+        _log(
+            f"🎬 Scene -> {scene_id} ({self._scene_index + 1}/{self._n_scenes})",
+            border_style="magenta",
         )
 
     def cycle_scene(self, step: int = 1) -> None:
@@ -194,11 +287,18 @@ class App:
             return
         self.hud_visible = visible
         self._scene_surf_size = None
+        if visible:
+            # Input is not tracked while hidden; don't show a stale label.
+            self._hud_last_input = "-"
+            self._hud_recent_inputs.clear()
+            self._hud_recent_str = ""
+            self._input_status_cache = None
 
     def toggle_hud(self) -> None:
         self._apply_hud_visibility(not self.hud_visible)
         self._toast_text = f"HUD {'ON' if self.hud_visible else 'OFF'}"
         self._toast_t = 1.0
+        self._hud_dirty = True
 
     def cycle_hud_mode(self) -> None:
         if not self.hud_visible:
@@ -214,10 +314,11 @@ class App:
             label = "HUD oculto"
         self._toast_text = label
         self._toast_t = 1.0
+        self._hud_dirty = True
 
     def scene_viewport(self) -> pygame.Rect:
-        w, h = self.screen.get_size()
-        return pygame.Rect(0, 0, w, h)
+        # A copy, so callers can move/inflate it without touching the cache.
+        return self._viewport_rect.copy()
 
     def hud_rect(self, rows: int | None = None) -> pygame.Rect:
         w, h = self.screen.get_size()
@@ -243,93 +344,84 @@ class App:
 
         while self.running:
             dt = self.clock.tick()
+            self._frame_no += 1
+            if self._frame_no % self._hud_refresh_interval == 0:
+                self._hud_dirty = True
 
             if self._toast_t > 0:
                 self._toast_t -= dt
                 if self._toast_t <= 0:
                     self._toast_text = None
-
-            events_start = perf_counter()
-            for ev in pygame.event.get():
+                    self._hud_dirty = True
+
+            # Frame timings only feed the HUD and the profiling summary.
+            measure = self.hud_visible or self._profiling_mode
+            capture_input = self.hud_visible
+            if measure:
+                t0 = perf_counter()
+            for ev in _poll_events():
                 if ev.type == pygame.QUIT:
                     self.running = False
                     continue
 
                 if ev.type == pygame.VIDEORESIZE:
+                    self._viewport_rect = self.screen.get_rect()
                     if self.scene:
                         self.scene.on_window_resize(ev.size)
                     continue
 
-                self._track_last_input(ev)
+                if capture_input:
+                    self._track_last_input(ev)
 
                 if ev.type == pygame.KEYDOWN:
-                    if ev.key == pygame.K_p:
-                        self._profiling_mode = not self._profiling_mode
-                        self._toast_text = (
-                            f"Profiling {'ON' if self._profiling_mode else 'OFF'}"
-                        )
-                        self._toast_t = 1.0
-                        self._profiling_frames = 0
-                        self._reset_profiling_accumulators()
-                        continue
-
-                    if ev.key == pygame.K_h:
-                        self.toggle_hud()
-                        continue
-
-                    if ev.key in (pygame.K_F2, pygame.K_TAB) and not (
-                        ev.mod & pygame.KMOD_SHIFT
-                    ):
-                        self.next_scene()
-                        continue
-
-                    if ev.key == pygame.K_F1 or (
-                        ev.key == pygame.K_TAB and (ev.mod & pygame.KMOD_SHIFT)
-                    ):
-                        self.prev_scene()
+                    handler = self._key_handlers.get(ev.key)
+                    if handler is not None:
+                        handler(ev)
                         continue
 
                 if ev.type == pygame.JOYBUTTONDOWN:
-                    self.joy_buttons_down.add(ev.button)
-
-                    # combo: 12 + 14
-                    if 12 in self.joy_buttons_down and 14 in self.joy_buttons_down:
-                        self.cycle_hud_mode()
-                        self.joy_buttons_down.clear()
-                        continue
+                    self.joy_buttons_mask |= 1 << ev.button
 
-                    if ev.button == 15:
-                        self.prev_scene()
-                        self.joy_buttons_down.clear()
-                        continue
+                    # Most buttons belong to the scene; skip the App checks for them.
+                    if ev.button in _APP_JOY_BUTTONS:
+                        if self.joy_buttons_mask & _HUD_COMBO_MASK == _HUD_COMBO_MASK:
+                            self.cycle_hud_mode()
+                            self.joy_buttons_mask = 0
+                            continue
 
-                    if ev.button == 16:
-                        self.next_scene()
-                        self.joy_buttons_down.clear()
-                        continue
+                        joy_handler = self._joy_button_handlers.get(ev.button)
+                        if joy_handler is not None:
+                            joy_handler()
+                            self.joy_buttons_mask = 0
+                            continue
 
                 if ev.type == pygame.JOYBUTTONUP:
-                    self.joy_buttons_down.discard(ev.button)
+                    self.joy_buttons_mask &= ~(1 << ev.button)
 
                 if self.scene is not None:
                     self.scene.handle_event(self, ev)
 
-            self._timings["events"] = (perf_counter() - events_start) * 1000.0
+            if measure:
+                t1 = perf_counter()
+                self._events_ms = (t1 - t0) * 1000.0
 
-            update_start = perf_counter()
             if self.scene is not None:
                 self.scene.update(self, dt)
-            self._timings["update"] = (perf_counter() - update_start) * 1000.0
+            if measure:
+                t2 = perf_counter()
+                self._update_ms = (t2 - t1) * 1000.0
 
-            render_start = perf_counter()
             vp = self.scene_viewport()
-            scene_surf = self._ensure_scene_surface(vp)
-
             if self.scene is not None:
-                self.scene.render(self, scene_surf)
-
-            self.screen.blit(scene_surf, vp.topleft)
-            self._timings["render"] = (perf_counter() - render_start) * 1000.0
+                # Any viewport other than the full-screen one needs its own surface.
+                if self.scene.needs_offscreen or vp != self._viewport_rect:
+                    scene_surf = self._ensure_scene_surface(vp)
+                    self.scene.render(self, scene_surf)
+                    self.screen.blit(scene_surf, vp.topleft)
+                else:
+                    self.scene.render(self, self.screen)
+            if measure:
+                self._render_ms = (perf_counter() - t2) * 1000.0
 
             self._update_hud_stats(dt)
 
@@ -338,10 +430,11 @@ class App:
 
             pygame.display.flip()
 
-            if self._profiling_mode:
+            if measure and self._profiling_mode:
                 self._profiling_frames += 1
-                for key in self._timings:
-                    self._profiling_accumulator[key] += self._timings[key]
+                self._prof_events_sum += self._events_ms
+                self._prof_update_sum += self._update_ms
+                self._prof_render_sum += self._render_ms
                 if self._profiling_frames >= self._profiling_frame_window:
                     self._emit_profiling_summary()
                     self._profiling_frames = 0
@@ -355,18 +448,27 @@ class App:
         pygame.quit()
 
     # --- Profiling helpers ----------------------------------------------
+    def toggle_profiling(self) -> None:
+        self._profiling_mode = not self._profiling_mode
+        self._toast_text = f"Profiling {'ON' if self._profiling_mode else 'OFF'}"
+        self._toast_t = 1.0
+        self._hud_dirty = True
+        self._profiling_frames = 0
+        self._reset_profiling_accumulators()
+
     def _reset_profiling_accumulators(self) -> None:
-        for key in self._profiling_accumulator:
-            self._profiling_accumulator[key] = 0.0
+        self._prof_events_sum = 0.0
+        self._prof_update_sum = 0.0
+        self._prof_render_sum = 0.0
 
     def _emit_profiling_summary(self) -> None:
         frames = self._profiling_frame_window
         if frames <= 0:
             return
 
-        avg_events = self._profiling_accumulator["events"] / frames
-        avg_update = self._profiling_accumulator["update"] / frames
-        avg_render = self._profiling_accumulator["render"] / frames
+        avg_events = self._prof_events_sum / frames
+        avg_update = self._prof_update_sum / frames
+        avg_render = self._prof_render_sum / frames
 
         lines = [
             f"avg events {avg_events:0.2f}ms   update {avg_update:0.2f}ms   render {avg_render:0.2f}ms"
@@ -390,104 +492,111 @@ class App:
                 + ", ".join(f"{name} {time:0.2f}ms" for name, time in render_top)
             )
 
-        console.print(
-            Panel.fit("\n".join(lines), title="Profiling (avg)", border_style="yellow")
-        )
+        _log("\n".join(lines), border_style="yellow", title="Profiling (avg)")
 
     # --- HUD render ------------------------------------------------------
     def _render_hud(self, dt: float) -> None:
+        w, h = self.screen.get_size()
+        composite = self._hud_composite_surf
+        if self._hud_dirty or composite is None or composite.get_width() != w:
+            composite = self._compose_hud(dt, w)
+            self._hud_composite_surf = composite
+            self._hud_dirty = False
+
+        bar_h = composite.get_height()
+        bar_y = h - bar_h
+        self.screen.blit(self._ensure_hud_bar_surface(w, bar_h), (0, bar_y))
+        self.screen.blit(composite, (0, bar_y))
+
+    def _compose_hud(self, dt: float, w: int) -> pygame.Surface:
         extra_lines = self._build_hud_lines()
         rows = 1 + len(extra_lines)
-        r = self.hud_rect(rows)
-        w, bar_h, bar_y = r.w, r.h, r.y
         row_height = self.hud_height
+        bar_h = row_height * rows
 
-        bar = self._ensure_hud_bar_surface(w, bar_h, int(self.hud_alpha))
-        self.screen.blit(bar, (0, bar_y))
+        # Text layer only; the translucent bar is blitted separately.
+        composite = self._ensure_hud_composite_surface(w, bar_h)
+        composite.fill((0, 0, 0, 0))
 
         fps = 0.0 if dt <= 0 else (1.0 / dt)
-        scene_name = self.scene.__class__.__name__ if self.scene else "None"
-        scene_id = self._scene_ids[self._scene_index] if self._scene_ids else "-"
-        left_text = (
-            f"{scene_name}  [{scene_id} {self._scene_index + 1}/{len(self._scene_ids)}]"
-        )
-
-        center_text = f"FPS {fps:0.1f}   dt {dt * 1000:0.1f} ms"
+        # Quantize so steady frame rates keep hitting the text cache.
+        fps = round(fps * 2.0) * 0.5
+        dt_ms = round(dt * 2000.0) * 0.5
+        left_text = self._scene_label
+        center_text = f"FPS {fps:0.1f}   dt {dt_ms:0.1f} ms"
         right_text = self._toast_text or "F1/F2  TAB / SHIFT+TAB"
 
         pad_x = 12
-        line_h = self.hud_font.get_height()
-        y = bar_y + (row_height - line_h) // 2
+        line_h = self._hud_font_h
+        y = (row_height - line_h) // 2
 
-        t_left = self._hud_text_surface("left", left_text, (255, 255, 255))
-        self.screen.blit(t_left, (pad_x, y))
+        t_left = self._hud_text_surface(left_text, (255, 255, 255))
+        composite.blit(t_left, (pad_x, y))
 
-        t_center = self._hud_text_surface("center", center_text, (200, 200, 200))
+        t_center = self._hud_text_surface(center_text, (200, 200, 200))
         cx = (w - t_center.get_width()) // 2
-        self.screen.blit(t_center, (cx, y))
+        composite.blit(t_center, (cx, y))
 
-        t_right = self._hud_text_surface("right", right_text, (180, 220, 180))
+        t_right = self._hud_text_surface(right_text, (180, 220, 180))
         rx = w - t_right.get_width() - pad_x
-        self.screen.blit(t_right, (rx, y))
+        composite.blit(t_right, (rx, y))
 
         for idx, line in enumerate(extra_lines, start=1):
-            ty = bar_y + idx * row_height + (row_height - line_h) // 2
-            surface = self._hud_text_surface(f"extra_{idx}", line.text, line.color)
+            ty = idx * row_height + (row_height - line_h) // 2
+            surface = self._hud_text_surface(line.text, line.color)
             if line.align == "center":
                 tx = (w - surface.get_width()) // 2
             elif line.align == "right":
                 tx = w - surface.get_width() - pad_x
             else:
                 tx = pad_x
-            self.screen.blit(surface, (tx, ty))
+            composite.blit(surface, (tx, ty))
 
-        pygame.draw.line(self.screen, (70, 70, 70), (0, bar_y), (w, bar_y), 1)
+        pygame.draw.line(composite, (70, 70, 70), (0, 0), (w, 0), 1)
+        return composite
 
     def _hud_text_surface(
-        self, key: str, text: str, color: tuple[int, int, int]
+        self, text: str, color: tuple[int, int, int]
     ) -> pygame.Surface:
-        cached = self._hud_text_cache.get(key)
-        if cached and cached[0] == text:
-            return cached[1]
-        surface = self.hud_font.render(text, True, color)
-        self._hud_text_cache[key] = (text, surface)
+        key = (text, color)
+        cache = self._hud_text_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+        surface = self.hud_font.render(text, True, color).convert_alpha()
+        cache[key] = surface
+        if len(cache) > self._hud_text_cache_size:
+            cache.popitem(last=False)
         return surface
 
-    def _ensure_hud_bar_surface(
-        self, width: int, height: int, alpha: int
-    ) -> pygame.Surface:
-        size = (width, height)
-        if (
-            self._hud_bar_surface is None
-            or self._hud_bar_size != size
-            or self._hud_bar_alpha != alpha
-        ):
-            bar = pygame.Surface(size, pygame.SRCALPHA)
-            bar.fill((20, 20, 20, alpha))
+    def _ensure_hud_bar_surface(self, width: int, height: int) -> pygame.Surface:
+        # Opaque surface + surface alpha blits faster than a per-pixel SRCALPHA fill.
+        key = ((width, height), int(self.hud_alpha))
+        if self._hud_bar_surface is None or self._hud_bar_key != key:
+            bar = pygame.Surface(key[0]).convert()
+            bar.fill((20, 20, 20))
+            bar.set_alpha(key[1])
             self._hud_bar_surface = bar
-            self._hud_bar_size = size
-            self._hud_bar_alpha = alpha
+            self._hud_bar_key = key
         return self._hud_bar_surface
 
+    def _ensure_hud_composite_surface(self, width: int, height: int) -> pygame.Surface:
+        surface = self._hud_composite_surf
+        if surface is None or surface.get_size() != (width, height):
+            surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        return surface
+
     # --- HUD data --------------------------------------------------------
     def _track_last_input(self, ev: pygame.event.Event) -> None:
-        label: str | None = None
-        if ev.type == pygame.KEYDOWN:
-            label = f"Key {pygame.key.name(ev.key)}"
-        elif ev.type == pygame.MOUSEBUTTONDOWN:
-            label = f"Mouse {ev.button}"
-        elif ev.type == pygame.MOUSEWHEEL:
-            label = "Mouse wheel"
-        elif ev.type == pygame.JOYBUTTONDOWN:
-            label = f"Joy{ev.joy} Btn{ev.button}"
-        elif ev.type == pygame.JOYAXISMOTION:
-            label = f"Joy{ev.joy} Axis{ev.axis}:{ev.value:0.2f}"
-        elif ev.type == pygame.JOYHATMOTION:
-            label = f"Joy{ev.joy} Hat{ev.hat} {ev.value}"
-
+        fn = self._input_label_fns.get(ev.type)
+        label = fn(ev) if fn else None
         if label:
             self._hud_last_input = label
             self._hud_recent_inputs.appendleft(label)
+            self._hud_recent_str = ", ".join(self._hud_recent_inputs)
+            self._input_status_cache = None
+            self._hud_dirty = True
 
     def _build_hud_lines(self) -> list[HudLine]:
         lines: list[HudLine] = []
@@ -503,23 +612,42 @@ class App:
 
         if self._hud_show_timings:
             timings_text = (
-                f"Frame events {self._timings['events']:0.1f}ms   "
-                f"update {self._timings['update']:0.1f}ms   "
-                f"render {self._timings['render']:0.1f}ms"
+                f"Frame events {self._events_ms:0.1f}ms   "
+                f"update {self._update_ms:0.1f}ms   "
+                f"render {self._render_ms:0.1f}ms"
             )
             lines.append(HudLine(timings_text, (160, 200, 255), "center"))
 
         return [line for line in lines if line.text]
 
     def _input_status_text(self) -> str:
-        pads = len(self.joysticks)
-        pressed = len(self.joy_buttons_down)
-        recent = ", ".join(self._hud_recent_inputs)
+        key = (len(self.joysticks), self.joy_buttons_mask)
+        cached = self._input_status_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        pads, mask = key
+        pressed = bin(mask).count("1")
+        recent = self._hud_recent_str
         if recent:
             recent = f"  recent [{recent}]"
-        return f"Input: pads {pads}  btn {pressed}  last {self._hud_last_input}{recent}"
+        text = f"Input: pads {pads}  btn {pressed}  last {self._hud_last_input}{recent}"
+        self._input_status_cache = (key, text)
+        return text
 
     def _audio_status_text(self) -> str:
+        # Only shown in the HUD, so refreshing every few frames is plenty.
+        cached = self._audio_status_cache
+        if (
+            cached is not None
+            and self._frame_no - cached[0] < self._audio_status_interval
+        ):
+            return cached[1]
+        text = self._compose_audio_status_text()
+        self._audio_status_cache = (self._frame_no, text)
+        return text
+
+    def _compose_audio_status_text(self) -> str:
         if not pygame.mixer.get_init():
             return "Audio: mixer OFF"
 
@@ -541,25 +669,30 @@ class App:
 
     def _busy_channels(self) -> int:
         total = pygame.mixer.get_num_channels()
+        if len(self._mixer_channels) != total:
+            self._mixer_channels = [pygame.mixer.Channel(idx) for idx in range(total)]
         busy = 0
-        for idx in range(total):
-            if pygame.mixer.Channel(idx).get_busy():
+        for channel in self._mixer_channels:
+            if channel.get_busy():
                 busy += 1
         return busy
 
     def _avg_timings_text(self) -> str:
         return (
             f"Avg FPS {self._avg_fps:0.1f}  dt {self._avg_dt_ms:0.1f}ms  "
-            f"events {self._avg_timings['events']:0.2f}ms  "
-            f"update {self._avg_timings['update']:0.2f}ms  "
-            f"render {self._avg_timings['render']:0.2f}ms"
+            f"events {self._avg_events_ms:0.2f}ms  "
+            f"update {self._avg_update_ms:0.2f}ms  "
+            f"render {self._avg_render_ms:0.2f}ms"
         )
 
     def _update_hud_stats(self, dt: float) -> None:
+        if not self.hud_visible and not self._profiling_mode:
+            return
         fps = 0.0 if dt <= 0 else 1.0 / dt
         alpha = self._hud_stats_alpha
-        self._avg_fps = (1 - alpha) * self._avg_fps + alpha * fps
-        self._avg_dt_ms = (1 - alpha) * self._avg_dt_ms + alpha * (dt * 1000.0)
-        for key, value in self._timings.items():
-            prev = self._avg_timings.get(key, 0.0)
-            self._avg_timings[key] = (1 - alpha) * prev + alpha * value
+        keep = self._hud_stats_keep
+        self._avg_fps = keep * self._avg_fps + alpha * fps
+        self._avg_dt_ms = keep * self._avg_dt_ms + alpha * (dt * 1000.0)
+        self._avg_events_ms = keep * self._avg_events_ms + alpha * self._events_ms
+        self._avg_update_ms = keep * self._avg_update_ms + alpha * self._update_ms
+        self._avg_render_ms = keep * self._avg_render_ms + alpha * self._render_ms
@@ -5,9 +5,16 @@ class GameClock:
     """Wrapper around pygame.time.Clock that filters dt spikes for physics."""
 
     def __init__(
-        self, fps: int, *, spike_limit: float = 2.5, smoothing: float = 0.25
+        self,
+        fps: int,
+        *,
+        spike_limit: float = 2.5,
+        smoothing: float = 0.25,
+        busy_loop: bool = False,
     ) -> None:
         self._clock = pygame.time.Clock()
+        # tick_busy_loop spins instead of relying on SDL_Delay's coarse sleep.
+        self._tick = self._clock.tick_busy_loop if busy_loop else self._clock.tick
         self._fps = max(1, int(fps))
 
         self._target_dt = 1.0 / self._fps
@@ -22,7 +29,7 @@ class GameClock:
         return self._last_raw_dt
 
     def tick(self) -> float:
-        raw = self._clock.tick(self._fps) / 1000.0
+        raw = self._tick(self._fps) / 1000.0
         self._last_raw_dt = raw
 
         if raw <= 0:
@@ -13,10 +13,17 @@ class WindowConfig:
     fullscreen: bool
     display_index: int | None
     window_pos: tuple[int, int] | None
+    # Busy-wait the end of each frame for tighter pacing (costs CPU).
+    low_latency: bool = False
+    # Present through an SDL texture (SCALED) with vsync instead of a software window.
+    scaled: bool = False
+    # Keep decoded background layers under ~/.cache/pvm between runs.
+    image_disk_cache: bool = True
 
 
 def load_window_config(path: Path) -> WindowConfig:
-    data = tomllib.loads(path.read_text())
+    with path.open("rb") as fh:
+        data = tomllib.load(fh)
     w = data["window"]
     window_pos_raw = w.get("window_pos", None)
     window_pos = None
@@ -34,4 +41,7 @@ def load_window_config(path: Path) -> WindowConfig:
         fullscreen=w.get("fullscreen", False),
         display_index=w.get("display_index", None),
         window_pos=window_pos,
+        low_latency=bool(w.get("low_latency", False)),
+        scaled=bool(w.get("scaled", False)),
+        image_disk_cache=bool(w.get("image_disk_cache", True)),
     )
@@ -1,5 +1,44 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import hashlib
 import importlib.resources
+import os
+import struct
+import tempfile
+import time
+
+import pygame
+
+
+# Loaded (and optionally scaled) images shared by every sprite/layer user.
+# LRU bounded by pixel memory so large background layers can't pile up.
+_IMAGE_CACHE_MAX_BYTES = 200 * 1024 * 1024
+_image_cache: OrderedDict[tuple[str, tuple[int, int] | None], pygame.Surface] = (
+    OrderedDict()
+)
+_image_cache_bytes = 0
+
+# Decoded RGBA pixels of big layers kept on disk, so later runs skip the PNG
+# decode. Best effort: any I/O problem just falls back to a normal load.
+_DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+_DISK_CACHE_TTL_S = 30 * 24 * 60 * 60
+_DISK_CACHE_HEADER = struct.Struct("<II")  # width, height
+_disk_cache_enabled = True
+_disk_cache_pruned = False  # set by the first write of the process
+
+# Decodes started ahead of time by prefetch_image(), keyed by (path, disk_cache)
+# so a load only picks up a decode done the way it asked for.
+_DECODE_WORKERS = 4
+_decode_pool: ThreadPoolExecutor | None = None
+_pending_decodes: dict[tuple[str, bool], Future[pygame.Surface]] = {}
+
+
+@lru_cache(maxsize=None)
+def _package_root(package: str) -> Path:
+    # Resolving a package's Traversable walks its loader; do it once per package.
+    return importlib.resources.files(package)
 
 
 def get_asset_path(relative_path: str) -> Path:
@@ -8,11 +47,194 @@ def get_asset_path(relative_path: str) -> Path:
     Returns the path to an asset file using importlib.resources.
 
     """
-    base_path = importlib.resources.files("game.assets")
+    base_path = _package_root("game.assets")
     resolved_path = base_path.joinpath(relative_path)
     return resolved_path
 
 
+def set_disk_cache_enabled(enabled: bool) -> None:
+    """Turns the `disk_cache` option of load_image/prefetch_image on or off."""
+    global _disk_cache_enabled
+    _disk_cache_enabled = enabled
+
+
+def load_image(
+    path: str | Path,
+    size: tuple[int, int] | None = None,
+    *,
+    mipmap: bool = False,
+    disk_cache: bool = False,
+) -> pygame.Surface:
+    """
+
+    Loads an image with convert_alpha(), smoothscaled to `size` if given,
+    memoized per (path, size). The surfaces are shared: never draw on them.
+    With `mipmap`, big downscales start from the nearest half-size level.
+    With `disk_cache`, the decoded pixels are also kept under the user cache
+    dir so the next run skips decoding the file (see set_disk_cache_enabled).
+
+    """
+    key = (str(path), size)
+    cached = _image_cache.get(key)
+    if cached is not None:
+        _image_cache.move_to_end(key)
+        return cached
+
+    if size is None:
+        disk_cache = disk_cache and _disk_cache_enabled
+        pending = _pending_decodes.pop((key[0], disk_cache), None)
+        if pending is not None:
+            # Decoded on a worker; the display conversion stays on this thread.
+            surface = pending.result().convert_alpha()
+        elif disk_cache:
+            surface = _load_decoded(path).convert_alpha()
+        else:
+            surface = pygame.image.load(path).convert_alpha()
+    else:
+        surface = load_image(path, disk_cache=disk_cache)
+        if mipmap:
+            surface = _mip_level(path, surface, size)
+        if surface.get_size() != size:
+            surface = pygame.transform.smoothscale(surface, size)
+    _cache_image(key, surface)
+    return surface
+
+
+def prefetch_image(path: str | Path, *, disk_cache: bool = False) -> None:
+    """
+
+    Starts decoding `path` on a worker thread so a later load_image(path)
+    with the same `disk_cache` only waits for it. No-op if the image is
+    already loaded or pending.
+
+    """
+    global _decode_pool
+    disk_cache = disk_cache and _disk_cache_enabled
+    key = (str(path), disk_cache)
+    if (key[0], None) in _image_cache or key in _pending_decodes:
+        return
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(
+            max_workers=_DECODE_WORKERS, thread_name_prefix="image-decode"
+        )
+    decode = _load_decoded if disk_cache else pygame.image.load
+    _pending_decodes[key] = _decode_pool.submit(decode, path)
+
+
+def _mip_level(
+    path: str | Path, base: pygame.Surface, size: tuple[int, int]
+) -> pygame.Surface:
+    """Smallest successive half-size level of `base` that still covers `size`."""
+    level = base
+    width, height = base.get_size()
+    target_w, target_h = size
+    if target_w <= 0 or target_h <= 0:
+        return base
+    while width // 2 >= target_w and height // 2 >= target_h:
+        width //= 2
+        height //= 2
+        # Levels live in the same LRU, each one halved from the level above.
+        key = (str(path), (width, height))
+        half = _image_cache.get(key)
+        if half is None:
+            half = pygame.transform.smoothscale(level, (width, height))
+            _cache_image(key, half)
+        level = half
+    return level
+
+
+def _cache_image(
+    key: tuple[str, tuple[int, int] | None], surface: pygame.Surface
+) -> None:
+    global _image_cache_bytes
+    _image_cache[key] = surface
+    _image_cache_bytes += _surface_bytes(surface)
+    # Evicted surfaces stay alive for whoever still holds them.
+    while _image_cache_bytes > _IMAGE_CACHE_MAX_BYTES and len(_image_cache) > 1:
+        _, evicted = _image_cache.popitem(last=False)
+        _image_cache_bytes -= _surface_bytes(evicted)
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def _disk_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "pvm"
+
+
+def _load_decoded(path: str | Path) -> pygame.Surface:
+    """pygame.image.load(path), served from the raw-pixel disk cache if fresh."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return pygame.image.load(path)
+
+    # mtime/size in the key: an edited file simply misses and gets re-cached.
+    key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    cache_file = _disk_cache_dir() / (hashlib.sha1(key.encode()).hexdigest() + ".raw")
+    try:
+        data = cache_file.read_bytes()
+        width, height = _DISK_CACHE_HEADER.unpack_from(data)
+        pixels = data[_DISK_CACHE_HEADER.size :]
+        if len(pixels) == width * height * 4:
+            os.utime(cache_file)  # LRU stamp for _prune_disk_cache
+            return pygame.image.frombytes(pixels, (width, height), "RGBA")
+    except (OSError, struct.error, ValueError, pygame.error):
+        pass
+
+    surface = pygame.image.load(path)
+    global _disk_cache_pruned
+    tmp_file: str | None = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: a worker and the main thread may write the same key.
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as fh:
+            tmp_file = fh.name
+            fh.write(_DISK_CACHE_HEADER.pack(*surface.get_size()))
+            fh.write(pygame.image.tobytes(surface, "RGBA"))
+        os.replace(tmp_file, cache_file)
+        tmp_file = None
+        if not _disk_cache_pruned:
+            _disk_cache_pruned = True
+            _prune_disk_cache(cache_file.parent)
+    except OSError:
+        if tmp_file is not None:
+            Path(tmp_file).unlink(missing_ok=True)
+    return surface
+
+
+def _prune_disk_cache(cache_dir: Path) -> None:
+    """Drops expired entries, then the least recently used beyond the size cap.
+
+    Called once per process; the cache can overshoot the cap until next run.
+    """
+    now = time.time()
+    entries = []
+    for entry in cache_dir.glob("*.raw"):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        if now - stat.st_mtime > _DISK_CACHE_TTL_S:
+            entry.unlink(missing_ok=True)
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total <= _DISK_CACHE_MAX_BYTES:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
 def get_config_path(relative_path: str) -> Path:
     """
 
@@ -24,7 +246,7 @@ def get_config_path(relative_path: str) -> Path:
 
     """
 
-    base_path = importlib.resources.files("game.configs")
+    base_path = _package_root("game.configs")
 
     print(f"DEBUG: get_config_path - base_path: {base_path}, type: {type(base_path)}")
 
@@ -41,6 +263,6 @@ def get_composition_path(relative_path: str) -> Path:
     Returns the path to a composition file using importlib.resources.
 
     """
-    base_path = importlib.resources.files("game.compositions")
+    base_path = _package_root("game.compositions")
     resolved_path = base_path.joinpath(relative_path)
     return resolved_path
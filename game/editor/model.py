@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field, is_dataclass, asdict
 from pathlib import Path
 from typing import Any, Iterable, Literal
 
 import json
+import os
 
 import pygame
 
@@ -41,14 +43,21 @@ class Node:
 class EditorModel:
     """Godot-style hierarchical model for environments/entities."""
 
+    _COMPOSITION_ID_PREFIX: dict[str, str] = {"entity": "ent-", "environment": "env-"}
+
     def __init__(self, registry: PaletteRegistry) -> None:
         self.registry = registry
+        # Single worker so background saves land on disk in request order.
+        self._save_executor: ThreadPoolExecutor | None = None
+        self._pending_save: Future | None = None
         self._initialize_state()
 
     def _initialize_state(self) -> None:
         self.nodes: dict[int, Node] = {}
         self._order: list[int] = []
         self._label_counts: dict[str, int] = {}
+        # Next label per base name, formatted ahead of the spawn that uses it.
+        self._next_label: dict[str, str] = {}
         self._composition_id_counts: dict[PaletteKind, int] = {
             "entity": 0,
             "environment": 0,
@@ -169,17 +178,17 @@ class EditorModel:
         self._order.insert(max(0, index), node_id)
 
     def _make_label(self, base: str) -> str:
-        count = self._label_counts.get(base, 0)
-        self._label_counts[base] = count + 1
-        if count == 0:
-            return base
-        return f"{base} #{count + 1}"
+        label = self._next_label.get(base, base)
+        count = self._label_counts.get(base, 0) + 1
+        self._label_counts[base] = count
+        self._next_label[base] = base + " #" + str(count + 1)
+        return label
 
     def _make_composition_id(self, kind: PaletteKind) -> str:
-        prefix = "ent" if kind == "entity" else "env"
+        prefix = self._COMPOSITION_ID_PREFIX.get(kind, "env-")
         current = self._composition_id_counts.get(kind, 0) + 1
         self._composition_id_counts[kind] = current
-        return f"{prefix}-{current:03d}"
+        return prefix + format(current, "03d")
 
     def _create_root(self) -> int:
         root = Node(
@@ -244,20 +253,19 @@ class EditorModel:
         """DFS that yields (depth, node) from the root."""
 
         order_index = {node_id: idx for idx, node_id in enumerate(self._order)}
+        order_key = lambda cid: order_index.get(cid, -1)  # noqa: E731
 
-        def _visit(node_id: int, depth: int) -> Iterable[tuple[int, Node]]:
+        # Explicit stack; children are pushed reversed so they pop in order.
+        stack: list[tuple[int, int]] = [(self.root_id, 0)]
+        while stack:
+            node_id, depth = stack.pop()
             node = self.nodes.get(node_id)
             if node is None:
-                return []
+                continue
 
             yield (depth, node)
-            children = sorted(
-                node.children, key=lambda cid: order_index.get(cid, -1)
-            )
-            for child_id in children:
-                yield from _visit(child_id, depth + 1)
-
-        yield from _visit(self.root_id, 0)
+            children = sorted(node.children, key=order_key)
+            stack.extend((child_id, depth + 1) for child_id in reversed(children))
 
     def selected_node(self) -> Node | None:
         if self.selected_id is None:
@@ -308,17 +316,22 @@ class EditorModel:
     def select_at_position(self, mouse_pos: tuple[int, int]) -> int | None:
         mx, my = mouse_pos
         best_id: int | None = None
-        best_d2: float | None = None
-        for node in self.iter_drawable_nodes():
-            pos = node.position()
+        best_d2 = float("inf")
+        nodes = self.nodes
+        for node_id in self._order:
+            node = nodes.get(node_id)
+            if node is None or node.payload is None:
+                continue
+            # Read pos in place; Node.position() would copy it into a Vector2.
+            pos = getattr(node.payload, "pos", None)
             if pos is None:
                 continue
-            dx = mx - float(pos.x)
-            dy = my - float(pos.y)
+            dx = mx - pos[0]
+            dy = my - pos[1]
             d2 = dx * dx + dy * dy
-            if best_d2 is None or d2 < best_d2:
+            if d2 < best_d2:
                 best_d2 = d2
-                best_id = node.id
+                best_id = node_id
 
         self.select_node(best_id)
         return best_id
@@ -380,16 +393,24 @@ class EditorModel:
             self.selected_id = None
 
     def _remove_subtree(self, node_id: int) -> None:
-        node = self.nodes.pop(node_id, None)
+        node = self.nodes.get(node_id)
         if node is None:
             return
-        for child_id in list(node.children):
-            self._remove_subtree(child_id)
         if node.parent is not None:
             parent = self.nodes.get(node.parent)
-            if parent is not None:
-                parent.children = [cid for cid in parent.children if cid != node_id]
-        self._order = [nid for nid in self._order if nid != node_id]
+            if parent is not None and node_id in parent.children:
+                parent.children.remove(node_id)
+
+        # Collect the whole subtree first, then filter _order in one pass.
+        removed: set[int] = set()
+        stack = [node_id]
+        while stack:
+            current = self.nodes.pop(stack.pop(), None)
+            if current is None:
+                continue
+            removed.add(current.id)
+            stack.extend(current.children)
+        self._order = [nid for nid in self._order if nid not in removed]
 
     # ---------- Export / Persistencia ----------
 
@@ -469,17 +490,55 @@ class EditorModel:
         *,
         metadata: dict[str, Any] | None = None,
         scene: dict[str, Any] | None = None,
+        background: bool = False,
     ) -> Path:
-        """Serializa el estado del editor a un archivo EEI."""
+        """Serializa el estado del editor a un archivo EEI.
+
+        With ``background=True`` the snapshot is still taken here, but JSON
+        encoding and the disk write run on a worker thread.
+        """
 
         data = self.build_composition(metadata=metadata, scene=scene)
         file_path = Path(path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        if background:
+            if self._save_executor is None:
+                self._save_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="editor-save"
+                )
+            self._pending_save = self._save_executor.submit(
+                self._write_composition_background, file_path, data
+            )
+            return file_path
+
+        self.wait_for_pending_save()
+        self._write_composition(file_path, data)
         return file_path
 
+    def wait_for_pending_save(self) -> None:
+        """Block until the last background save has been written."""
+        pending = self._pending_save
+        if pending is not None:
+            pending.result()
+            self._pending_save = None
+
+    @staticmethod
+    def _write_composition(file_path: Path, data: dict[str, Any]) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        # Write then rename so readers never see a half-written file.
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def _write_composition_background(
+        cls, file_path: Path, data: dict[str, Any]
+    ) -> None:
+        try:
+            cls._write_composition(file_path, data)
+        except Exception as exc:  # pragma: no cover - feedback
+            print(f"[EditorModel] Failed to save composition: {exc}")
+
     # ----- Helpers -----
 
     def _base_name_from_type_path(self, type_path: str) -> str:
@@ -581,6 +640,10 @@ class EditorModel:
         return None
 
     def _coerce_state_value(self, value: Any) -> Any:
+        # Exact-type fast path; subclasses and dataclasses use the chain below.
+        coerce = self._STATE_COERCERS.get(type(value))
+        if coerce is not None:
+            return coerce(self, value)
         if isinstance(value, pygame.Vector2):
             return [float(value.x), float(value.y)]
         if isinstance(value, (int, float, str, bool)) or value is None:
@@ -594,3 +657,27 @@ class EditorModel:
         if is_dataclass(value) and not isinstance(value, type):
             return asdict(value)
         return repr(value)
+
+    def _coerce_identity(self, value: Any) -> Any:
+        return value
+
+    def _coerce_vector2(self, value: pygame.Vector2) -> list[float]:
+        return [float(value.x), float(value.y)]
+
+    def _coerce_sequence(self, value: list | tuple) -> list[Any]:
+        return [self._coerce_state_value(v) for v in value]
+
+    def _coerce_mapping(self, value: dict) -> dict[str, Any]:
+        return {str(k): self._coerce_state_value(v) for k, v in value.items()}
+
+    _STATE_COERCERS = {
+        int: _coerce_identity,
+        float: _coerce_identity,
+        str: _coerce_identity,
+        bool: _coerce_identity,
+        type(None): _coerce_identity,
+        pygame.Vector2: _coerce_vector2,
+        list: _coerce_sequence,
+        tuple: _coerce_sequence,
+        dict: _coerce_mapping,
+    }
@@ -22,6 +22,9 @@ class MassEntity(Entity):
     ) -> None:
         self.pos = pygame.Vector2(pos) if pos is not None else pygame.Vector2(0, 0)
         self.mass = max(self._MIN_MASS, float(mass))
+        # 1/mass, recomputed in integrate() only when `mass` is edited.
+        self._inv_mass = 1.0 / self.mass
+        self._inv_mass_for = self.mass
 
         self.PIXELS_PER_METER = self.DEFAULT_PIXELS_PER_METER
 
@@ -29,34 +32,57 @@ class MassEntity(Entity):
         self.velocity = (
             self._v2(velocity) * self.PIXELS_PER_METER if velocity else pygame.Vector2()
         )
-        self._force_accumulator = pygame.Vector2()  # in "px-N": force * PPM
+        # Accumulated force in "px-N" (force * PPM), as two plain floats.
+        self._fx = 0.0
+        self._fy = 0.0
 
     # -----------------------------
     # PHYSICS API (real units)
     # -----------------------------
     def clear_forces(self) -> None:
-        self._force_accumulator.update(0, 0)
+        self._fx = 0.0
+        self._fy = 0.0
 
     def apply_force(self, force: pygame.Vector2 | tuple[float, float]) -> None:
         """Force in Newtons (kg·m/s²)."""
-        f = self._v2(force)
-        self._force_accumulator += f * self.PIXELS_PER_METER
+        fx, fy = self._xy(force)
+        self.apply_force_xy(fx, fy)
+
+    def apply_force_xy(self, fx: float, fy: float) -> None:
+        """Same as `apply_force`, without packing the components."""
+        ppm = self.PIXELS_PER_METER
+        self._fx += fx * ppm
+        self._fy += fy * ppm
 
     def apply_acceleration(self, accel: pygame.Vector2 | tuple[float, float]) -> None:
         """Acceleration in m/s² (gravity, etc.)."""
-        a = self._v2(accel)
-        self._force_accumulator += a * self.mass * self.PIXELS_PER_METER
-
-    def integrate(self, dt: float) -> None:
-        if dt <= 0:
-            self.clear_forces()
-            return
+        ax, ay = self._xy(accel)
+        self.apply_acceleration_xy(ax, ay)
 
-        acceleration_px = self._force_accumulator / self.mass  # (m/s²)*PPM -> px/s²
-        self.velocity += acceleration_px * dt
-        self.pos += self.velocity * dt
+    def apply_acceleration_xy(self, ax: float, ay: float) -> None:
+        """Same as `apply_acceleration`, without packing the components."""
+        k = self.mass * self.PIXELS_PER_METER
+        self._fx += ax * k
+        self._fy += ay * k
 
-        self.clear_forces()
+    def integrate(self, dt: float) -> None:
+        if dt > 0:
+            # Component-wise, in place: no temporary Vector2 per entity per frame.
+            # force / mass = (m/s²)*PPM -> px/s²
+            mass = self.mass
+            if mass != self._inv_mass_for:
+                self._inv_mass = 1.0 / mass
+                self._inv_mass_for = mass
+            scale = dt * self._inv_mass
+            vel = self.velocity
+            vel.x += self._fx * scale
+            vel.y += self._fy * scale
+            pos = self.pos
+            pos.x += vel.x * dt
+            pos.y += vel.y * dt
+
+        self._fx = 0.0
+        self._fy = 0.0
 
     # -----------------------------
     # CONTROL HELPERS (cheap)
@@ -64,10 +90,7 @@ class MassEntity(Entity):
     def clamp_velocity_x(self, max_speed_mps: float) -> None:
         """Clamp vx using real units (m/s)."""
         vmax = float(max_speed_mps) * self.PIXELS_PER_METER
-        if self.velocity.x > vmax:
-            self.velocity.x = vmax
-        elif self.velocity.x < -vmax:
-            self.velocity.x = -vmax
+        self.velocity.x = max(-vmax, min(vmax, self.velocity.x))
 
     def apply_damping_x(self, damping_per_s: float) -> None:
         """
@@ -77,15 +100,19 @@ class MassEntity(Entity):
         d = float(damping_per_s)
         if d <= 0.0:
             return
-        # v is in px/s; convert to m/s to compute force in N.
-        vx_mps = self.velocity.x / self.PIXELS_PER_METER
-        fx = -self.mass * d * vx_mps
-        self.apply_force((fx, 0.0))
+        # Force in N is -m*d*(vx/PPM); the accumulator stores N*PPM, so the
+        # PPM factors cancel and vx (px/s) can be used directly.
+        self._fx -= self.mass * d * self.velocity.x
+
+    @staticmethod
+    def _xy(v) -> tuple[float, float]:
+        # Plain tuples are the common case (apply_force((fx, 0.0))).
+        if isinstance(v, (tuple, pygame.Vector2, list)) and len(v) == 2:
+            return float(v[0]), float(v[1])
+        return 0.0, 0.0
 
     @staticmethod
     def _v2(v) -> pygame.Vector2:
-        if isinstance(v, pygame.Vector2):
-            return pygame.Vector2(v)
-        if isinstance(v, (tuple, list)) and len(v) == 2:
-            return pygame.Vector2(float(v[0]), float(v[1]))
-        return pygame.Vector2()
+        """Coerces to a new Vector2."""
+        x, y = MassEntity._xy(v)
+        return pygame.Vector2(x, y)
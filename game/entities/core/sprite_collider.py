@@ -5,7 +5,7 @@ from typing import ClassVar
 
 import pygame
 from game.entities.core.base import AppLike
-from game.core.resources import get_asset_path
+from game.core.resources import get_asset_path, load_image
 
 
 class SpriteColliderMixin:
@@ -25,6 +25,8 @@ class SpriteColliderMixin:
     COLLIDER_ANCHOR: ClassVar[tuple[float, float]] = (0.5, 1.0)
     COLLIDER_OFFSET: ClassVar[pygame.Vector2 | tuple[float, float] | None] = None
     _surface_cache: ClassVar[dict[str, pygame.Surface]] = {}
+    # (class, SPRITE_PATH) -> resolved asset path, shared by every instance.
+    _asset_path_cache: ClassVar[dict[tuple[type, str], Path | None]] = {}
 
     def __init__(
         self,
@@ -39,11 +41,17 @@ class SpriteColliderMixin:
         collider_kwargs.setdefault("visible", show_collider)
         super().__init__(pos, **collider_kwargs)
         self._sprite: pygame.Surface | None = None
+        # Blit position is recomputed only when `pos` changes (e.g. editor drag).
+        self._blit_key: tuple[float, float] | None = None
+        self._blit_pos: tuple[int, int] = (0, 0)
+        self._blit_rect = pygame.Rect(0, 0, 0, 0)
 
     # ------------------------------------------------------------------
     def on_spawn(self, app: AppLike) -> None:
         super().on_spawn(app)
         self._sprite = self._ensure_sprite()
+        if self._sprite is not None:
+            self._blit_pos_for(self._sprite)
 
     def on_despawn(self, app: AppLike) -> None:
         super().on_despawn(app)
@@ -52,11 +60,22 @@ class SpriteColliderMixin:
     def render(self, app: AppLike, screen: pygame.Surface) -> None:
         sprite = self._sprite or self._ensure_sprite()
         if sprite is not None:
-            rect = sprite.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-            screen.blit(sprite, rect)
+            blit_pos = self._blit_pos_for(sprite)
+            # Cheap reject for sprites entirely outside the target surface.
+            if self._blit_rect.colliderect(screen.get_clip()):
+                screen.blit(sprite, blit_pos)
 
         super().render(app, screen)
 
+    def _blit_pos_for(self, sprite: pygame.Surface) -> tuple[int, int]:
+        pos = self.pos
+        key = (pos.x, pos.y)
+        if key != self._blit_key:
+            self._blit_key = key
+            self._blit_rect = sprite.get_rect(center=(int(pos.x), int(pos.y)))
+            self._blit_pos = self._blit_rect.topleft
+        return self._blit_pos
+
     # ------------------------------------------------------------------
     def _ensure_sprite(self) -> pygame.Surface | None:
         key = self._cache_key()
@@ -81,8 +100,14 @@ class SpriteColliderMixin:
             )
             return None
 
+        size: tuple[int, int] | None = None
+        if self.RENDER_SIZE is not None:
+            width, height = self.RENDER_SIZE
+            if width > 0 and height > 0:
+                size = (int(width), int(height))
+
         try:
-            sprite = pygame.image.load(path).convert_alpha()
+            return load_image(path, size)
         except FileNotFoundError:
             print(f"[{self.__class__.__name__}] Sprite not found: {path}")
             return None
@@ -90,15 +115,19 @@ class SpriteColliderMixin:
             print(f"[{self.__class__.__name__}] Failed to load {path}: {exc}")
             return None
 
-        if self.RENDER_SIZE is not None:
-            width, height = self.RENDER_SIZE
-            if width > 0 and height > 0:
-                sprite = pygame.transform.smoothscale(sprite, (int(width), int(height)))
-
-        return sprite
-
     @classmethod
     def _resolve_asset_path(cls) -> Path | None:
+        key = (cls, cls.SPRITE_PATH)
+        try:
+            return cls._asset_path_cache[key]
+        except KeyError:
+            pass
+        path = cls._lookup_asset_path()
+        cls._asset_path_cache[key] = path
+        return path
+
+    @classmethod
+    def _lookup_asset_path(cls) -> Path | None:
         if not cls.SPRITE_PATH:
             return None
 
@@ -38,6 +38,11 @@ class VisibleMassEntity(MassEntity):
         self.color = self._to_color(color, fallback=(76, 139, 245))
         self.outline_color = self._to_color(outline_color, fallback=(18, 44, 92))
         self.label_color = self._to_color(label_color, fallback=(255, 255, 255))
+        # attr name -> (raw value, converted Color) for values set as str/tuple.
+        self._color_cache: dict[str, tuple[object, pygame.Color]] = {}
+        # Pre-drawn box (fill + outline), rebuilt when its size or colors change.
+        self._body: pygame.Surface | None = None
+        self._body_key: tuple[int, int, pygame.Color, pygame.Color] | None = None
 
         if isinstance(size, (int, float)):
             self.size = pygame.Vector2(max(4.0, size), max(4.0, size))
@@ -81,15 +86,10 @@ class VisibleMassEntity(MassEntity):
         center = rect.center
 
         # Re-coerce color if it was overwritten with a string.
-        fill = self._to_color(
-            getattr(self, "color", (76, 139, 245)), fallback=(76, 139, 245)
-        )
-        outline = self._to_color(
-            getattr(self, "outline_color", (18, 44, 92)), fallback=(18, 44, 92)
-        )
+        fill = self._cached_color("color", (76, 139, 245))
+        outline = self._cached_color("outline_color", (18, 44, 92))
 
-        pygame.draw.rect(screen, fill, rect, border_radius=4)
-        pygame.draw.rect(screen, outline, rect, width=2, border_radius=4)
+        screen.blit(self._body_surface(rect.size, fill, outline), rect)
 
         if self.show_velocity:
             self._draw_velocity(screen, center, outline)
@@ -180,6 +180,20 @@ class VisibleMassEntity(MassEntity):
         self._node_id = None
         self._environment_id = None
 
+    def _body_surface(
+        self, size: tuple[int, int], fill: pygame.Color, outline: pygame.Color
+    ) -> pygame.Surface:
+        key = (size[0], size[1], fill, outline)
+        if self._body is None or key != self._body_key:
+            self._body_key = (size[0], size[1], pygame.Color(fill), pygame.Color(outline))
+            body = pygame.Surface(size, pygame.SRCALPHA)
+            rect = body.get_rect()
+            # Opaque ink: drawing straight onto the canvas ignored alpha as well.
+            pygame.draw.rect(body, fill[:3], rect, border_radius=4)
+            pygame.draw.rect(body, outline[:3], rect, width=2, border_radius=4)
+            self._body = body.convert_alpha()
+        return self._body
+
     def _collider_rect(self, pos: pygame.Vector2 | None = None) -> pygame.Rect:
         center = pos if pos is not None else self.pos
         half = self._half_size()
@@ -216,9 +230,7 @@ class VisibleMassEntity(MassEntity):
         font = getattr(app, "hud_font", None) or self._get_label_font()
 
         # Blindaje otra vez por si label_color fue pisado
-        label = self._to_color(
-            getattr(self, "label_color", (255, 255, 255)), fallback=(255, 255, 255)
-        )
+        label = self._cached_color("label_color", (255, 255, 255))
 
         text = font.render(f"{self.mass:.2f}", True, label)
         rect = text.get_rect(center=center)
@@ -231,6 +243,18 @@ class VisibleMassEntity(MassEntity):
         return cls._label_font
 
     # ------------------------------------------------------------------
+    def _cached_color(self, attr: str, fallback: tuple[int, int, int]) -> pygame.Color:
+        """Color held in `attr`, converted again only when the attribute changes."""
+        value = getattr(self, attr, fallback)
+        if isinstance(value, pygame.Color):
+            return value
+        cached = self._color_cache.get(attr)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        color = self._to_color(value, fallback=fallback)
+        self._color_cache[attr] = (value, color)
+        return color
+
     @staticmethod
     def _clamp8(x: float | int) -> int:
         return max(0, min(255, int(x)))
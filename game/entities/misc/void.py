@@ -25,14 +25,30 @@ class VoidEntity(Entity):
         self.visible = bool(visible)
         self.radius = max(1.0, float(radius))
         self.color = self._to_color(color)
+        # Converted draw color; refreshed only if `color` is reassigned.
+        self._color_src: object = self.color
+        self._draw_color = self.color
+        # Integer center, recomputed only when `pos` changes (e.g. editor drag).
+        self._center_key: tuple[float, float] | None = None
+        self._center: tuple[int, int] = (0, 0)
 
     def render(self, app: AppLike, screen: pygame.Surface) -> None:
+        # Checked per frame: the editor inspector can toggle `visible` live.
         if not self.visible:
             return
 
-        center = (int(self.pos.x), int(self.pos.y))
-        color = self._to_color(getattr(self, "color", self.color))
-        pygame.draw.circle(screen, color, center, int(self.radius), width=1)
+        color = self.color
+        if color is not self._color_src:
+            self._color_src = color
+            self._draw_color = self._to_color(color)
+        pos = self.pos
+        key = (pos.x, pos.y)
+        if key != self._center_key:
+            self._center_key = key
+            self._center = (int(pos.x), int(pos.y))
+        pygame.draw.circle(
+            screen, self._draw_color, self._center, int(self.radius), width=1
+        )
 
     @staticmethod
     def _to_color(value: pygame.Color | str | tuple[int, int, int]) -> pygame.Color:
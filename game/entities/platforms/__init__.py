@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import ClassVar, Sequence
 
 import pygame
 
@@ -31,6 +31,33 @@ class SpritePlatform(SpriteColliderMixin, Platform):
     ) -> None:
         super().__init__(pos, show_collider=show_collider, **platform_kwargs)
 
+    # --- Batched render ---
+    @staticmethod
+    def can_batch(instance: object) -> bool:
+        """True when `instance` draws only its sprite with the default render."""
+        return (
+            isinstance(instance, SpritePlatform)
+            and not instance.visible
+            and type(instance).render is SpritePlatform.render
+        )
+
+    @staticmethod
+    def batch_render(
+        platforms: Sequence[SpritePlatform], screen: pygame.Surface
+    ) -> None:
+        """Blits a run of `can_batch` platforms with a single `screen.blits`."""
+        view = screen.get_clip()
+        blits = []
+        for platform in platforms:
+            sprite = platform._sprite or platform._ensure_sprite()
+            if sprite is None:
+                continue
+            blit_pos = platform._blit_pos_for(sprite)
+            if platform._blit_rect.colliderect(view):
+                blits.append((sprite, blit_pos))
+        if blits:
+            screen.blits(blits, doreturn=False)
+
 
 class GrassSmallPlatform(SpritePlatform):
     """Short grass platform."""
@@ -39,15 +66,6 @@ class GrassSmallPlatform(SpritePlatform):
     RENDER_SIZE = (192, 60)
     COLLIDER_SIZE = pygame.Vector2(175, 40)
 
-    def __init__(
-        self,
-        pos: pygame.Vector2 | tuple[float, float] | None = None,
-        *,
-        show_collider: bool = False,
-        **platform_kwargs,
-    ) -> None:
-        super().__init__(pos, show_collider=show_collider, **platform_kwargs)
-
 
 class GrassWidePlatform(SpritePlatform):
     """Medium grass platform."""
@@ -56,15 +74,6 @@ class GrassWidePlatform(SpritePlatform):
     RENDER_SIZE = (256, 72)
     COLLIDER_SIZE = pygame.Vector2(230, 50)
 
-    def __init__(
-        self,
-        pos: pygame.Vector2 | tuple[float, float] | None = None,
-        *,
-        show_collider: bool = False,
-        **platform_kwargs,
-    ) -> None:
-        super().__init__(pos, show_collider=show_collider, **platform_kwargs)
-
 
 class GrassLargePlatform(SpritePlatform):
     """Long platform for horizontal sections."""
@@ -73,14 +82,6 @@ class GrassLargePlatform(SpritePlatform):
     RENDER_SIZE = (320, 84)
     COLLIDER_SIZE = pygame.Vector2(300, 40)
 
-    def __init__(
-        self,
-        pos: pygame.Vector2 | tuple[float, float] | None = None,
-        *,
-        show_collider: bool = False,
-        **platform_kwargs,
-    ) -> None:
-        super().__init__(pos, show_collider=show_collider, **platform_kwargs)
 
 class GrassFloorPlatform(SpritePlatform):
     """Wide segment that can act as a base floor."""
@@ -89,15 +90,6 @@ class GrassFloorPlatform(SpritePlatform):
     RENDER_SIZE = (720, 480)
     COLLIDER_SIZE = pygame.Vector2(720, 110)
 
-    def __init__(
-        self,
-        pos: pygame.Vector2 | tuple[float, float] | None = None,
-        *,
-        show_collider: bool = False,
-        **platform_kwargs,
-    ) -> None:
-        super().__init__(pos, show_collider=show_collider, **platform_kwargs)
-
 
 __all__ = [
     "SpritePlatform",
@@ -61,7 +61,7 @@ class PlayableMassEntity(VisibleMassEntity, SpriteColliderMixin):
 
     # ----- jump -----------------------------------------------------------
     def _start_jump(self) -> None:
-        ppm = float(getattr(self, "PIXELS_PER_METER", 100.0))
+        ppm = self.PIXELS_PER_METER
 
         # set initial upward velocity (convert m/s -> px/s)
         self.velocity.y = -self.JUMP_IMPULSE * ppm
@@ -84,7 +84,7 @@ class PlayableMassEntity(VisibleMassEntity, SpriteColliderMixin):
         self._bind_runtime(app)
 
         grounded = bool(getattr(self, "grounded", False))
-        ppm = float(getattr(self, "PIXELS_PER_METER", 100.0))
+        ppm = self.PIXELS_PER_METER
 
         # ----------------------------
         # HORIZONTAL movement by forces (cheap + stable)
@@ -104,17 +104,14 @@ class PlayableMassEntity(VisibleMassEntity, SpriteColliderMixin):
         if move_dir != 0:
             # accelerate left/right: F = m*a
             ax = move_dir * accel
-            self.apply_force((self.mass * ax, 0.0))
+            self.apply_force_xy(self.mass * ax, 0.0)
         else:
             # linear damping: F = -m * damping * v
-            self.apply_force((-self.mass * damping * vx_mps, 0.0))
+            self.apply_force_xy(-self.mass * damping * vx_mps, 0.0)
 
         # clamp vx to max speed (in px/s)
         vmax_px = self.MAX_SPEED_X * ppm
-        if self.velocity.x > vmax_px:
-            self.velocity.x = vmax_px
-        elif self.velocity.x < -vmax_px:
-            self.velocity.x = -vmax_px
+        self.velocity.x = max(-vmax_px, min(vmax_px, self.velocity.x))
 
         # ----------------------------
         # JUMP HOLD: sustained upward thrust while holding
@@ -126,7 +123,7 @@ class PlayableMassEntity(VisibleMassEntity, SpriteColliderMixin):
 
         if self._jump_time_left > 0.0 and self._is_jumping and self._jump_pressed:
             # upward thrust: a = -JUMP_HOLD_ACCEL (m/s^2)
-            self.apply_force((0.0, -self.mass * self.JUMP_HOLD_ACCEL))
+            self.apply_force_xy(0.0, -self.mass * self.JUMP_HOLD_ACCEL)
             self._jump_time_left -= dt
             if self._jump_time_left <= 0.0:
                 self._jump_time_left = 0.0
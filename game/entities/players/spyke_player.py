@@ -5,7 +5,7 @@ from typing import Any
 
 import pygame
 
-from game.core.resources import get_asset_path
+from game.core.resources import get_asset_path, load_image
 from game.entities.players.playable import PlayableMassEntity
 
 
@@ -27,11 +27,15 @@ class AnimTuning:
     jump: JumpPhases = field(default_factory=JumpPhases)
 
 
-@dataclass
+# Slotted: the runtime fields are read/written every frame. Entities stay
+# dict-based because the editor serializes them through __dict__.
+@dataclass(slots=True)
 class AnimClip:
     frames: list[pygame.Surface]
     fps: float = 10.0
     loop: bool = True
+    # Horizontally mirrored copies of `frames` (same order), for facing left.
+    flipped: list[pygame.Surface] = field(default_factory=list)
 
     # runtime
     t: float = 0.0
@@ -56,15 +60,17 @@ class AnimClip:
             return
 
         self.t += dt
-        frame_time = 1.0 / self.fps
+        # Closed form: a long dt (e.g. after a stall) costs the same as a short one.
+        steps = int(self.t * self.fps)
+        if steps <= 0:
+            return
 
-        while self.t >= frame_time:
-            self.t -= frame_time
-            self.idx += 1
-            if self.loop:
-                self.idx %= len(self.frames)
-            else:
-                self.idx = min(self.idx, len(self.frames) - 1)
+        self.t -= steps / self.fps
+        n = len(self.frames)
+        if self.loop:
+            self.idx = (self.idx + steps) % n
+        else:
+            self.idx = min(self.idx + steps, n - 1)
 
     def current(self) -> pygame.Surface:
         if not self.frames:
@@ -96,36 +102,40 @@ class SpriteAnimator:
             try:
                 relative_frame_path = relative_folder_path / f"{i}.png"
                 full_path = get_asset_path(relative_frame_path.as_posix())
-                surf = pygame.image.load(full_path).convert_alpha()
-                frames.append(surf)
-                i += 1
+                surf = load_image(full_path)
             except FileNotFoundError:
                 break
+            frames.append(self._scaled(full_path, surf))
+            i += 1
 
         if not frames:
             raise FileNotFoundError(
                 f"No frames found for state {state!r} in {relative_folder_path}"
             )
 
-        if self.scale_factor is not None and self.scale_factor != 1.0:
-            for i in range(len(frames)):
-                surf = frames[i]
-                original_size = surf.get_size()
-                new_size = (
-                    int(original_size[0] * self.scale_factor),
-                    int(original_size[1] * self.scale_factor),
-                )
+        flipped = [pygame.transform.flip(surf, True, False) for surf in frames]
+        self.clips[state] = AnimClip(frames=frames, fps=fps, loop=loop, flipped=flipped)
 
-                if self.min_size is not None:
-                    new_size = (
-                        max(new_size[0], self.min_size[0]),
-                        max(new_size[1], self.min_size[1]),
-                    )
+    def _scaled(self, full_path: Path, surf: pygame.Surface) -> pygame.Surface:
+        if self.scale_factor is None or self.scale_factor == 1.0:
+            return surf
 
-                if new_size != original_size:
-                    frames[i] = pygame.transform.smoothscale(surf, new_size)
+        original_size = surf.get_size()
+        new_size = (
+            int(original_size[0] * self.scale_factor),
+            int(original_size[1] * self.scale_factor),
+        )
+
+        if self.min_size is not None:
+            new_size = (
+                max(new_size[0], self.min_size[0]),
+                max(new_size[1], self.min_size[1]),
+            )
 
-        self.clips[state] = AnimClip(frames=frames, fps=fps, loop=loop)
+        if new_size == original_size:
+            return surf
+        # Cached per (path, size), so later spawns skip the smoothscale.
+        return load_image(full_path, new_size)
 
     @property
     def current_clip(self) -> AnimClip | None:
@@ -155,6 +165,8 @@ class SpriteAnimator:
 
         surf = clip.current()
         if self.facing < 0:
+            if clip.flipped:
+                return clip.flipped[clip.idx]
             surf = pygame.transform.flip(surf, True, False)
         return surf
 
@@ -220,7 +232,7 @@ class SpykePlayer(PlayableMassEntity):
         self._bind_runtime(app)
 
         grounded = bool(getattr(self, "grounded", False))
-        ppm = float(getattr(self, "PIXELS_PER_METER", 100.0))
+        ppm = self.PIXELS_PER_METER
 
         move_dir = 0
         if self._left and not self._right:
@@ -235,9 +247,9 @@ class SpykePlayer(PlayableMassEntity):
 
         if move_dir != 0:
             ax = move_dir * accel
-            self.apply_force((self.mass * ax, 0.0))
+            self.apply_force_xy(self.mass * ax, 0.0)
         else:
-            self.apply_force((-self.mass * damping * vx_mps, 0.0))
+            self.apply_force_xy(-self.mass * damping * vx_mps, 0.0)
 
         vmax_px = self.MAX_SPEED_X * ppm
         self.velocity.x = max(-vmax_px, min(vmax_px, self.velocity.x))
@@ -246,7 +258,7 @@ class SpykePlayer(PlayableMassEntity):
             self._start_jump()
 
         if self._jump_time_left > 0.0 and self._is_jumping and self._jump_pressed:
-            self.apply_force((0.0, -self.mass * self.JUMP_HOLD_ACCEL))
+            self.apply_force_xy(0.0, -self.mass * self.JUMP_HOLD_ACCEL)
             self._jump_time_left -= dt
             if self._jump_time_left <= 0.0:
                 self._jump_time_left = 0.0
@@ -259,7 +271,6 @@ class SpykePlayer(PlayableMassEntity):
 
         if grounded_now:
             self._jump_time_left = 0.0
-            self.anim.set_state("idle")
             self._is_jumping = False
             if self.velocity.y > 0.0:
                 self.velocity.y = 0.0
@@ -279,7 +290,7 @@ class SpykePlayer(PlayableMassEntity):
             if self._land_hold_timer > 0.0:
                 self._land_hold_timer = max(0.0, self._land_hold_timer - dt)
 
-            ppm = float(getattr(self, "PIXELS_PER_METER", 100.0))
+            ppm = self.PIXELS_PER_METER
             vx_px = float(self.velocity.x)
             vy_px = float(self.velocity.y)
             vx_mps = vx_px / ppm
@@ -386,7 +397,7 @@ class SpykePlayer(PlayableMassEntity):
 
         try:
             full_path = get_asset_path(candidate_relative_paths[0])
-            surf = pygame.image.load(full_path).convert_alpha()
+            surf = load_image(full_path)
         except (FileNotFoundError, pygame.error):
             return None
 
@@ -405,7 +416,7 @@ class SpykePlayer(PlayableMassEntity):
             )
 
             if new_size != original_size:
-                surf = pygame.transform.smoothscale(surf, new_size)
+                surf = load_image(full_path, new_size)
 
         cls._preview_surface = surf
         return surf
@@ -6,7 +6,7 @@ from typing import Sequence
 import pygame
 
 from game.environments.base import Environment, AppLike
-from game.core.resources import get_asset_path
+from game.core.resources import get_asset_path, load_image, prefetch_image
 
 
 class BackgroundEnvironment(Environment):
@@ -35,6 +35,9 @@ class BackgroundEnvironment(Environment):
             list(layers) if layers is not None else list(DEFAULT_BACKGROUND_PATHS)
         )
         self.fill_color = fill_color
+        # Parsed fill color; re-parsed only if `fill_color` is reassigned.
+        self._fill_src: object = fill_color
+        self._fill_rgba = self._coerce_color(fill_color)
         self.target_size = target_size
         if target_size is not None:
             self.size = pygame.Vector2(target_size)
@@ -43,26 +46,47 @@ class BackgroundEnvironment(Environment):
 
         self._surface: pygame.Surface | None = None
         self._surface_size: tuple[int, int] | None = None
+        # Display-format target (SRCALPHA unless the fill is opaque) reused by
+        # every recompose of the same size.
+        self._scratch: pygame.Surface | None = None
         self._layer_size: tuple[int, int] | None = None
         self._layer_probe_path: str | None = None
 
+        # layer string -> resolved path; filled here so bad configs show up at
+        # construction, and lazily for layers added later (e.g. from the editor).
+        self._resolved_layers: dict[str, Path | None] = {}
+        for layer_path in self.layers:
+            self._resolved_layer(layer_path)
+
     def on_spawn(self, app: AppLike) -> None:
+        # Decode every layer on the workers at once; _compose_background then
+        # only waits for them and converts/scales on this thread.
+        for layer_path in self.layers:
+            resolved_path = self._resolved_layer(layer_path)
+            if resolved_path is not None:
+                prefetch_image(resolved_path, disk_cache=True)
         size = self._initial_scene_size(app)
         self._compose_background(app, size)
 
     def on_despawn(self, app: AppLike) -> None:
         self._surface = None
         self._surface_size = None
+        self._scratch = None
 
     def render(self, app: AppLike, screen: pygame.Surface) -> None:
         desired_size = self._desired_surface_size(app, screen)
         if self._surface is None or self._surface_size != desired_size:
             self._compose_background(app, desired_size)
 
-        if self._surface is None:
+        surface = self._surface
+        if surface is None:
             return
 
-        screen.blit(self._surface, (int(self.pos.x), int(self.pos.y)))
+        dest = surface.get_rect(topleft=(int(self.pos.x), int(self.pos.y)))
+        # Cheap reject when the background sits entirely outside the target.
+        if not dest.colliderect(screen.get_clip()):
+            return
+        screen.blit(surface, dest)
 
     def _desired_surface_size(
         self, app: AppLike, screen: pygame.Surface
@@ -120,37 +144,82 @@ class BackgroundEnvironment(Environment):
                     self._layer_size = None
                     self._layer_probe_path = None
 
-        composed = pygame.Surface((width, height), pygame.SRCALPHA)
-        color = self._coerce_color(self.fill_color)
-        if color is not None:
-            composed.fill(color)
-
+        layer_surfaces: list[pygame.Surface] = []
         if first_surface is not None:
             if first_surface.get_size() != (width, height):
                 first_surface = pygame.transform.smoothscale(
                     first_surface, (width, height)
                 )
-            composed.blit(first_surface, (0, 0))
+            layer_surfaces.append(first_surface)
 
         for layer_path in layer_iter:
             layer_surface = self._load_layer(layer_path, app, (width, height))
             if layer_surface is None:
                 continue
-            composed.blit(layer_surface, (0, 0))
+            layer_surfaces.append(layer_surface)
 
-        self._surface = composed.convert_alpha()
+        # A single opaque layer covers the fill entirely: keep it as an opaque
+        # display-format copy and skip the alpha composition.
+        if (
+            len(self.layers) == 1
+            and len(layer_surfaces) == 1
+            and self._is_opaque(layer_surfaces[0])
+        ):
+            self._surface = layer_surfaces[0].convert()
+            self._surface_size = (width, height)
+            return
+
+        fill = self.fill_color
+        if fill is not self._fill_src:
+            self._fill_src = fill
+            self._fill_rgba = self._coerce_color(fill)
+        color = self._fill_rgba
+        # An opaque fill stays opaque whatever is blended over it, so the result
+        # needs no per-pixel alpha and can take the cheaper opaque blit.
+        opaque = color is not None and color[3] == 255
+        composed = self._ensure_scratch((width, height), opaque)
+        composed.fill(color if color is not None else (0, 0, 0, 0))
+        if layer_surfaces:
+            composed.blits(
+                [(layer_surface, (0, 0)) for layer_surface in layer_surfaces],
+                doreturn=False,
+            )
+
+        self._surface = composed
         self._surface_size = (width, height)
 
+    @staticmethod
+    def _is_opaque(surface: pygame.Surface) -> bool:
+        if not surface.get_flags() & pygame.SRCALPHA:
+            return True
+        width, height = surface.get_size()
+        return pygame.mask.from_surface(surface, 254).count() == width * height
+
+    def _ensure_scratch(self, size: tuple[int, int], opaque: bool) -> pygame.Surface:
+        scratch = self._scratch
+        if (
+            scratch is None
+            or scratch.get_size() != size
+            or bool(scratch.get_flags() & pygame.SRCALPHA) == opaque
+        ):
+            if opaque:
+                scratch = pygame.Surface(size).convert()
+            else:
+                scratch = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self._scratch = scratch
+        return scratch
+
     def _load_layer(
         self, layer_path: str, app: AppLike, size: tuple[int, int] | None
     ) -> pygame.Surface | None:
-        resolved_path = self._resolve_layer_path(app, layer_path)
+        resolved_path = self._resolved_layer(layer_path)
         if resolved_path is None:
-            print(f"[BackgroundEnvironment] Invalid layer path: {layer_path!r}")
             return None
 
         try:
-            image = pygame.image.load(resolved_path).convert_alpha()
+            # Decoded once per process (and kept decoded on disk across runs);
+            # recomposes and other instances reuse it.
+            image = load_image(resolved_path, disk_cache=True)
         except FileNotFoundError:
             print(f"[BackgroundEnvironment] Archivo no encontrado: {resolved_path}")
             return None
@@ -159,10 +228,25 @@ class BackgroundEnvironment(Environment):
             return None
 
         if size is not None and image.get_size() != size:
-            image = pygame.transform.smoothscale(image, size)
+            # Cached per (path, size): recomposing at a known size skips smoothscale.
+            image = load_image(resolved_path, size, mipmap=True, disk_cache=True)
 
         return image
 
+    def _resolved_layer(self, layer_path: str) -> Path | None:
+        if not isinstance(layer_path, str):
+            print(f"[BackgroundEnvironment] Invalid layer path: {layer_path!r}")
+            return None
+        try:
+            return self._resolved_layers[layer_path]
+        except KeyError:
+            pass
+        resolved_path = self._resolve_layer_path(None, layer_path)
+        if resolved_path is None:
+            print(f"[BackgroundEnvironment] Invalid layer path: {layer_path!r}")
+        self._resolved_layers[layer_path] = resolved_path
+        return resolved_path
+
     def _resolve_layer_path(self, app: AppLike, layer_path: str) -> Path | None:
         if not isinstance(layer_path, str) or not layer_path.strip():
             return None
@@ -28,7 +28,9 @@ class ForceEnvironment(Environment):
 
         self._runtime = None
         self._node_id: str | None = None
-        self._force_vec = self._direction * self.magnitude
+        # Resolved once per bind: the runtime tree does not change after load.
+        self._mass_children: list[MassEntity] = []
+        self._force_siblings: list[ForceEnvironment] = []
 
     def on_spawn(self, app: AppLike) -> None:
         self._bind_runtime(app)
@@ -36,6 +38,8 @@ class ForceEnvironment(Environment):
     def on_despawn(self, app: AppLike) -> None:
         self._runtime = None
         self._node_id = None
+        self._mass_children = []
+        self._force_siblings = []
 
     def update(self, app: AppLike, dt: float) -> None:
         if self._runtime is None or self._node_id is None:
@@ -43,16 +47,13 @@ class ForceEnvironment(Environment):
             if self._runtime is None or self._node_id is None:
                 return
 
-        if self.magnitude != 0:
-            self._force_vec = self._direction * self.magnitude
-        else:
-            self._force_vec = pygame.Vector2(0, 0)
-
-        combined_force = self._combined_force_vector()
-        for entity in self._iter_child_mass_entities():
+        ax, ay = self._combined_acceleration()
+        auto_integrate = self.auto_integrate
+        # One pass over the cached batch of child mass entities.
+        for entity in self._mass_children:
             # magnitude = m/s² (9.81) and direction normalized
-            entity.apply_acceleration(combined_force)
-            if self.auto_integrate:
+            entity.apply_acceleration_xy(ax, ay)
+            if auto_integrate:
                 entity.integrate(dt)
 
     # --- Helpers ---------------------------------------------------------
@@ -68,18 +69,24 @@ class ForceEnvironment(Environment):
         runtime = getattr(scene, "runtime", None)
 
         if runtime is None:
-            self._runtime = None
-            self._node_id = None
+            self._unbind()
             return
 
         for node in runtime.iter_nodes():
             if node.instance is self:
                 self._runtime = runtime
                 self._node_id = node.id
+                self._mass_children = list(self._iter_child_mass_entities())
+                self._force_siblings = list(self._iter_sibling_force_envs(node.parent))
                 return
 
+        self._unbind()
+
+    def _unbind(self) -> None:
         self._runtime = None
         self._node_id = None
+        self._mass_children = []
+        self._force_siblings = []
 
     def _iter_child_mass_entities(self) -> Iterator[MassEntity]:
         if self._runtime is None or self._node_id is None:
@@ -100,19 +107,21 @@ class ForceEnvironment(Environment):
 
         return _gen()
 
-    def _combined_force_vector(self) -> pygame.Vector2:
-        if self._runtime is None or self._node_id is None:
-            return pygame.Vector2(self._force_vec)
-
-        node = self._runtime.nodes.get(self._node_id)
-        if node is None:
-            return pygame.Vector2(self._force_vec)
-
-        parent_id = node.parent
-        total = pygame.Vector2(0, 0)
-        for sibling in self._iter_sibling_force_envs(parent_id):
-            total += sibling._direction * sibling.magnitude
-        return total
+    def _own_acceleration(self) -> tuple[float, float]:
+        direction = self._direction
+        return direction.x * self.magnitude, direction.y * self.magnitude
+
+    def _combined_acceleration(self) -> tuple[float, float]:
+        if not self._force_siblings:
+            return self._own_acceleration()
+
+        # Summed as scalars: no Vector2 temporaries per sibling per frame.
+        ax = ay = 0.0
+        for sibling in self._force_siblings:
+            direction = sibling._direction
+            ax += direction.x * sibling.magnitude
+            ay += direction.y * sibling.magnitude
+        return ax, ay
 
     def _iter_sibling_force_envs(
         self, parent_id: str | None
@@ -60,15 +60,3 @@ class MusicEnvironment(Environment):
             return
         app.audio.stop_music(fade_ms=self.stop_fade_ms)
         self._active = False
-
-    def handle_event(self, app: AppLike, ev: pygame.event.Event) -> None:
-        """No event handling (placeholder for compatibility)."""
-        return
-
-    def update(self, app: AppLike, dt: float) -> None:
-        """No update logic needed."""
-        return
-
-    def render(self, app: AppLike, screen: pygame.Surface) -> None:
-        """Renders nothing."""
-        return
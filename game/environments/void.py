@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 import pygame
 
 from game.environments.base import Environment, AppLike
@@ -28,39 +30,74 @@ class VoidEnvironment(Environment):
         self.color = self._to_color(color)
         self.crosshair = bool(crosshair)
 
-    def handle_event(self, app: AppLike, ev: pygame.event.Event) -> None:
-        """No event handling; serves as a logical container."""
-        return
-
-    def update(self, app: AppLike, dt: float) -> None:
-        """No logic; only holds position/state."""
-        return
+        # Pre-drawn marker (circle + crosshair) and where to blit it. The marker
+        # is rebuilt on radius/color/crosshair changes, the position on moves.
+        self._marker: pygame.Surface | None = None
+        self._marker_key: tuple[int, bool, pygame.Color] | None = None
+        self._blit_key: tuple[float, float, int] | None = None
+        self._blit_pos: tuple[int, int] = (0, 0)
+        # Converted draw color; refreshed only if `color` is reassigned.
+        self._color_src: object = self.color
+        self._draw_color = self.color
 
     def render(self, app: AppLike, screen: pygame.Surface) -> None:
         if not self.visible:
             return
+        screen.blit(*self._marker_blit())
+
+    # --- Batched render ---
+    @staticmethod
+    def can_batch(instance: object) -> bool:
+        """True when `instance` uses the default marker render."""
+        return (
+            isinstance(instance, VoidEnvironment)
+            and type(instance).render is VoidEnvironment.render
+        )
+
+    @staticmethod
+    def batch_render(envs: Sequence[VoidEnvironment], screen: pygame.Surface) -> None:
+        """Blits the visible markers of a run of `can_batch` envs in one call."""
+        blits = [env._marker_blit() for env in envs if env.visible]
+        if blits:
+            screen.blits(blits, doreturn=False)
+
+    def _marker_blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        color = self.color
+        if color is not self._color_src:
+            self._color_src = color
+            self._draw_color = self._to_color(color)
 
-        center = (int(self.pos.x), int(self.pos.y))
-        color = self._to_color(getattr(self, "color", self.color))
         radius = int(self.radius)
-        pygame.draw.circle(screen, color, center, radius, width=1)
-
-        if self.crosshair:
-            arm = max(4, radius // 2)
-            pygame.draw.line(
-                screen,
-                color,
-                (center[0] - arm, center[1]),
-                (center[0] + arm, center[1]),
-                width=1,
-            )
-            pygame.draw.line(
-                screen,
-                color,
-                (center[0], center[1] - arm),
-                (center[0], center[1] + arm),
-                width=1,
-            )
+        marker_key = (radius, self.crosshair, self._draw_color)
+        if self._marker is None or marker_key != self._marker_key:
+            self._marker_key = marker_key
+            self._marker = self._build_marker(radius, self._draw_color, self.crosshair)
+            self._blit_key = None
+
+        pos = self.pos
+        blit_key = (pos.x, pos.y, radius)
+        if blit_key != self._blit_key:
+            self._blit_key = blit_key
+            half = self._marker.get_width() // 2
+            self._blit_pos = (int(pos.x) - half, int(pos.y) - half)
+
+        return self._marker, self._blit_pos
+
+    @staticmethod
+    def _build_marker(
+        radius: int, color: pygame.Color, crosshair: bool
+    ) -> pygame.Surface:
+        arm = max(4, radius // 2)
+        half = max(radius, arm) + 1
+        marker = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        # Opaque copy: drawing straight onto the (opaque) canvas ignores alpha too.
+        ink = pygame.Color(color.r, color.g, color.b)
+        center = (half, half)
+        pygame.draw.circle(marker, ink, center, radius, width=1)
+        if crosshair:
+            pygame.draw.line(marker, ink, (half - arm, half), (half + arm, half), width=1)
+            pygame.draw.line(marker, ink, (half, half - arm), (half, half + arm), width=1)
+        return marker.convert_alpha()
 
     @staticmethod
     def _to_color(value: pygame.Color | str | tuple[int, int, int]) -> pygame.Color:
@@ -6,6 +6,9 @@ from typing import Any
 
 import tomllib
 
+# (resolved path, mtime_ns) -> parsed profile, shared by every scene that loads it.
+_PROFILE_CACHE: dict[tuple[str, int], ControllerProfile] = {}
+
 
 @dataclass(frozen=True)
 class ControlDefinition:
@@ -42,6 +45,11 @@ class ControllerProfile:
         from game.core.resources import get_config_path
 
         cfg_path = get_config_path(relative_path)
+        # Parsed once per file version; editing the TOML changes mtime and reloads.
+        key = (str(cfg_path), cfg_path.stat().st_mtime_ns)
+        cached = _PROFILE_CACHE.get(key)
+        if cached is not None:
+            return cached
         with cfg_path.open("rb") as fh:
             data = tomllib.load(fh)
 
@@ -52,13 +60,15 @@ class ControllerProfile:
         axes = _parse_controls(data.get("axes") or [])
         hats = _parse_controls(data.get("hats") or [])
 
-        return cls(
+        profile = cls(
             name=name,
             deadzone=deadzone,
             buttons=buttons,
             axes=axes,
             hats=hats,
         )
+        _PROFILE_CACHE[key] = profile
+        return profile
 
     def button_label(self, control: str | int) -> str:
         return self._control_label(self.buttons, control, prefix="Button")
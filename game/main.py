@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import importlib.resources
 from pathlib import Path
 
@@ -7,12 +8,13 @@ from game.core.app import App
 from game.core.config import load_window_config
 
 
+@lru_cache(maxsize=None)
 def _share_path(*parts: str) -> Path:
     """
     Return the path to a packaged resource inside the 'game' directory.
 
     Uses importlib.resources to resolve the path robustly in both
-    development and installed environments.
+    development and installed environments. Memoized per `parts`.
     """
     return importlib.resources.files("game").joinpath(*parts)
 
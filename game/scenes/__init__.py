@@ -1,12 +1,28 @@
+from importlib import import_module
+
 from .base import Scene
-from .main import MainScene
-from .editor import EditorScene
-from .input_tester import InputTesterScene
-
-SCENES = {
-    "main": MainScene,
-    "editor": EditorScene,
-    "input_tester": InputTesterScene,
+
+# scene_id -> (module, class). Scene modules are imported on first use, so a
+# session that never opens the editor never pays for importing it.
+SCENE_SPECS: dict[str, tuple[str, str]] = {
+    "main": ("game.scenes.main", "MainScene"),
+    "editor": ("game.scenes.editor", "EditorScene"),
+    "input_tester": ("game.scenes.input_tester", "InputTesterScene"),
 }
 
+
+def load_scene(scene_id: str) -> type[Scene]:
+    module_name, class_name = SCENE_SPECS[scene_id]
+    return getattr(import_module(module_name), class_name)
+
+
+def __getattr__(name: str):
+    if name == "SCENES":
+        return {scene_id: load_scene(scene_id) for scene_id in SCENE_SPECS}
+    for scene_id, (_, class_name) in SCENE_SPECS.items():
+        if class_name == name:
+            return load_scene(scene_id)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["MainScene", "EditorScene", "InputTesterScene"]
@@ -11,6 +11,9 @@ class AppLike(Protocol):
 
 
 class Scene:
+    # Render into an intermediate surface instead of straight onto the display.
+    needs_offscreen: bool = False
+
     def on_enter(self, app: AppLike) -> None:
         pass
 
@@ -15,6 +15,7 @@ from game.scenes.editor_panels import (
     ResolutionPanel,
     ToolbarPanel,
     TreePanel,
+    render_text,
 )
 from game.input import ActionBinding, InputBinding, ControllerProfile
 
@@ -157,6 +158,8 @@ class EditorScene(Scene):
         self.scene_canvas_rect = pygame.Rect(0, 0, 0, 0)  # editable virtual space
         self._canvas_surface: pygame.Surface | None = None
         self._canvas_surface_size: tuple[int, int] | None = None
+        # Preview-sized destination reused by the per-frame smoothscale.
+        self._scaled_surface: pygame.Surface | None = None
         self.vcursor_enabled = False
         self.vcursor_pos = pygame.Vector2(80, 80)
         self.vcursor_vel = pygame.Vector2(0, 0)
@@ -166,6 +169,10 @@ class EditorScene(Scene):
         self.context_menu_active = False
         self.context_menu_rect = pygame.Rect(0, 0, 0, 0)
         self.context_menu_item_rects: list[tuple[str, pygame.Rect]] = []
+        # (key, rect, label surface) per item, rebuilt with the menu layout.
+        self._context_menu_render_items: list[
+            tuple[str, pygame.Rect, pygame.Surface]
+        ] = []
         self.context_menu_items: list[tuple[str, str]] = [("delete", "Delete")]
         self.context_menu_target_id: int | None = None
         self.context_menu_hover: str | None = None
@@ -188,15 +195,19 @@ class EditorScene(Scene):
         self._vscroll_speed_steps: float = 14.0  # steps/sec at full stick
         self._vscroll_accum: float = 0.0
 
-        self._load_controller_profile()
-
     def on_enter(self, app: AppLike) -> None:
+        # Read on entry rather than construction; the parsed profile is cached.
+        self._load_controller_profile()
         self._init_scene_canvas(app)
         self._update_resolution_options()
         self._sync_resolution_selection()
         self._sync_vcursor_enabled()
         self._load_initial_composition()
 
+    def on_exit(self, app: AppLike) -> None:
+        # The next scene may load the file we are still writing.
+        self.model.wait_for_pending_save()
+
     # ---------------- Layout ----------------
 
     def _init_scene_canvas(self, app: AppLike) -> None:
@@ -408,9 +419,18 @@ class EditorScene(Scene):
         self._sync_vcursor_enabled()
 
         if self.vcursor_enabled:
-            self.vcursor_pos += self.vcursor_vel * dt
-            self.vcursor_pos.x = max(0, min(self.scene_width - 1, self.vcursor_pos.x))
-            self.vcursor_pos.y = max(0, min(self.scene_height - 1, self.vcursor_pos.y))
+            # Component-wise with local bindings: no temporary Vector2 and no
+            # min()/max() calls on this per-frame path.
+            vp = self.vcursor_pos
+            vv = self.vcursor_vel
+            max_x = self.scene_width - 1
+            max_y = self.scene_height - 1
+            x = vp.x + vv.x * dt
+            y = vp.y + vv.y * dt
+            x = max_x if x > max_x else x
+            y = max_y if y > max_y else y
+            vp.x = 0 if x < 0 else x
+            vp.y = 0 if y < 0 else y
 
             # 🎮 right stick scroll -> "wheel steps"
             if self._vscroll_value != 0.0:
@@ -481,21 +501,31 @@ class EditorScene(Scene):
         target = self._ensure_canvas_surface()
         target.fill("white")
 
+        selected_id = self.model.selected_id
         for node in self.model.iter_drawable_nodes():
             renderer = getattr(node.payload, "render", None)
             if callable(renderer):
                 renderer(app, target)
-            if node.id == self.model.selected_id:
+            if node.id == selected_id:
                 self._render_selection_ring(target, node)
 
         if (target.get_width(), target.get_height()) == (rect.width, rect.height):
             screen.blit(target, rect.topleft)
         else:
-            scaled = pygame.transform.smoothscale(target, (rect.width, rect.height))
-            screen.blit(scaled, rect.topleft)
+            screen.blit(self._scale_canvas(target, rect.size), rect.topleft)
 
         pygame.draw.rect(screen, (200, 200, 200), rect, width=1, border_radius=6)
 
+    def _scale_canvas(
+        self, target: pygame.Surface, size: tuple[int, int]
+    ) -> pygame.Surface:
+        scaled = self._scaled_surface
+        if scaled is None or scaled.get_size() != size:
+            scaled = pygame.Surface(size).convert(target)
+            self._scaled_surface = scaled
+        # Scale into the kept surface instead of allocating one per frame.
+        return pygame.transform.smoothscale(target, size, scaled)
+
     def _render_selection_ring(self, surface: pygame.Surface, node) -> None:
         p = getattr(node.payload, "pos", None)
         if p is None:
@@ -513,13 +543,10 @@ class EditorScene(Scene):
         pygame.draw.rect(screen, (20, 20, 20), rect, border_radius=6)
         pygame.draw.rect(screen, (120, 120, 120), rect, width=1, border_radius=6)
 
-        label_map = {key: label for key, label in self.context_menu_items}
-        for key, item_rect in self.context_menu_item_rects:
-            hovered = key == self.context_menu_hover
-            color = (90, 50, 50) if hovered else (45, 45, 45)
+        hover = self.context_menu_hover
+        for key, item_rect, surf in self._context_menu_render_items:
+            color = (90, 50, 50) if key == hover else (45, 45, 45)
             pygame.draw.rect(screen, color, item_rect, border_radius=4)
-            text = label_map.get(key, key.title())
-            surf = self.font_mono.render(text, True, (235, 235, 235))
             ty = item_rect.y + (item_rect.height - surf.get_height()) // 2
             screen.blit(surf, (item_rect.x + 10, ty))
 
@@ -537,6 +564,7 @@ class EditorScene(Scene):
         self.context_menu_target_id = None
         self.context_menu_hover = None
         self.context_menu_item_rects = []
+        self._context_menu_render_items = []
         self.context_menu_stage = "root"
         self.context_menu_stage_data = {}
 
@@ -672,15 +700,19 @@ class EditorScene(Scene):
         rect = pygame.Rect(x, y, width, height)
 
         item_rects: list[tuple[str, pygame.Rect]] = []
+        render_items: list[tuple[str, pygame.Rect, pygame.Surface]] = []
         item_y = rect.y + pad
-        for key, _ in self.context_menu_items:
-            item_rects.append(
-                (key, pygame.Rect(rect.x + 4, item_y, rect.width - 8, item_h))
+        for key, label in self.context_menu_items:
+            item_rect = pygame.Rect(rect.x + 4, item_y, rect.width - 8, item_h)
+            item_rects.append((key, item_rect))
+            render_items.append(
+                (key, item_rect, render_text(self.font_mono, label, (235, 235, 235)))
             )
             item_y += item_h
 
         self.context_menu_rect = rect
         self.context_menu_item_rects = item_rects
+        self._context_menu_render_items = render_items
         self.context_menu_hover = None
 
     def _context_menu_root_items(self) -> list[tuple[str, str]]:
@@ -751,7 +783,7 @@ class EditorScene(Scene):
         if new_node is None:
             self._print_status("[Editor] Could not insert the item.")
             return False
-        self._save_composition()
+        self._save_composition(background=True)
         return True
 
     def _handle_context_menu_request(self, pos: tuple[int, int]) -> None:
@@ -818,7 +850,7 @@ class EditorScene(Scene):
         rect: pygame.Rect,
         title: str,
     ) -> None:
-        t = self.font.render(title, True, (220, 220, 220))
+        t = render_text(self.font, title, (220, 220, 220))
         screen.blit(t, (rect.x + 10, rect.y + 8))
         pygame.draw.line(
             screen,
@@ -1101,7 +1133,7 @@ class EditorScene(Scene):
         self.model.delete_selected()
         self.dragging = False
         self.drag_mode = None
-        self._save_composition()
+        self._save_composition(background=True)
         self._close_context_menu()
 
     # ---------- Saving ----------
@@ -1154,7 +1186,9 @@ class EditorScene(Scene):
         self._last_saved_path = path
         self._print_status(f"[Editor] Composition loaded from {path.name}")
 
-    def _save_composition(self, app: AppLike | None = None) -> bool:
+    def _save_composition(
+        self, app: AppLike | None = None, *, background: bool = False
+    ) -> bool:
         target = self._composition_output_path()
         canvas = [
             self.scene_canvas_rect.width or 640,
@@ -1165,6 +1199,7 @@ class EditorScene(Scene):
                 target,
                 metadata={"name": target.stem},
                 scene={"canvas": canvas, "origin": [0, 0]},
+                background=background,
             )
         except Exception as exc:  # pragma: no cover - feedback
             self._print_status(f"[Editor] Failed to save composition: {exc}")
@@ -1278,4 +1313,4 @@ class EditorScene(Scene):
             self.dragging = False
             self.drag_mode = None
             if was_spawn_new:
-                self._save_composition()
+                self._save_composition(background=True)
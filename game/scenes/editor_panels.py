@@ -1,12 +1,51 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar
 
 import pygame
 from game.editor import PaletteItem, PaletteRegistry
 
 
+# Rasterized labels shared by every panel, keyed by (font, text, color). Static
+# labels hit every frame; the LRU bound keeps changing values from piling up.
+_TEXT_CACHE_MAX = 1024
+_text_cache: OrderedDict[
+    tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface
+] = OrderedDict()
+
+
+def render_text(
+    font: pygame.font.Font, text: str, color: tuple[int, int, int]
+) -> pygame.Surface:
+    """font.render(text, True, color), memoized. Don't draw on the result."""
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
+    surf = font.render(text, True, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > _TEXT_CACHE_MAX:
+        _text_cache.popitem(last=False)
+    return surf
+
+
+def hover_index(
+    boxes: tuple[tuple[int, int, int, int], ...],
+    pos: tuple[int, int],
+    dy: int = 0,
+) -> int | None:
+    """Index of the first (x, y, w, h) box, shifted by `dy`, containing `pos`."""
+    mx, my = pos
+    my -= dy
+    for i, (x, y, w, h) in enumerate(boxes):
+        if x <= mx < x + w and y <= my < y + h:
+            return i
+    return None
+
+
 @dataclass
 class AttrEntry:
     label: str
@@ -61,7 +100,7 @@ class SectionPanel:
         rect: pygame.Rect,
         title: str,
     ) -> None:
-        t = self.font.render(title, True, (220, 220, 220))
+        t = render_text(self.font, title, (220, 220, 220))
         screen.blit(t, (rect.x + 10, rect.y + 8))
         pygame.draw.line(
             screen,
@@ -89,12 +128,17 @@ class ToolbarPanel:
         self._label_pad = label_pad
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.button_rects: dict[str, pygame.Rect] = {}
+        # Plain-int copies of button_rects (same order) for the per-frame hover test.
+        self._button_keys: tuple[str, ...] = ()
+        self._button_boxes: tuple[tuple[int, int, int, int], ...] = ()
 
     def set_rect(self, rect: pygame.Rect) -> None:
         self.rect = rect
 
     def rebuild_buttons(self) -> None:
         self.button_rects = {}
+        self._button_keys = ()
+        self._button_boxes = ()
         rect = self.rect
         if rect.width <= 0 or rect.height <= 0 or not self.buttons:
             return
@@ -118,6 +162,8 @@ class ToolbarPanel:
         for key, _ in self.buttons:
             self.button_rects[key] = pygame.Rect(x, y, btn_w, btn_h)
             x += btn_w + btn_gap
+        self._button_keys = tuple(self.button_rects)
+        self._button_boxes = tuple(tuple(r) for r in self.button_rects.values())
 
     def render(self, screen: pygame.Surface, mouse_pos: tuple[int, int]) -> None:
         rect = self.rect
@@ -126,11 +172,15 @@ class ToolbarPanel:
 
         pygame.draw.rect(screen, (25, 25, 25), rect, border_radius=6)
 
+        hovered_idx = hover_index(self._button_boxes, mouse_pos)
+        hovered_key = (
+            self._button_keys[hovered_idx] if hovered_idx is not None else None
+        )
         for key, label in self.buttons:
             btn_rect = self.button_rects.get(key)
             if btn_rect is None or btn_rect.width <= 0 or btn_rect.height <= 0:
                 continue
-            hovered = btn_rect.collidepoint(mouse_pos)
+            hovered = key == hovered_key
             base = (50, 50, 50)
             if key == "play":
                 base = (40, 80, 40)
@@ -149,12 +199,12 @@ class ToolbarPanel:
                 screen, (120, 120, 120), btn_rect, width=1, border_radius=6
             )
 
-            text = self.font_mono.render(label, True, (235, 235, 235))
+            text = render_text(self.font_mono, label, (235, 235, 235))
             tx = btn_rect.x + (btn_rect.width - text.get_width()) // 2
             ty = btn_rect.y + (btn_rect.height - text.get_height()) // 2
             screen.blit(text, (tx, ty))
 
-        header = self.font.render(self.title, True, (220, 220, 220))
+        header = render_text(self.font, self.title, (220, 220, 220))
         hx = rect.x + 12
         hy = rect.y + (rect.height - header.get_height()) // 2
         screen.blit(header, (hx, hy))
@@ -193,6 +243,11 @@ class PalettePanel(SectionPanel):
         self.environments_rect = pygame.Rect(0, 0, 0, 0)
         self.entity_item_rects: list[pygame.Rect] = []
         self.environment_item_rects: list[pygame.Rect] = []
+        # Plain-int copies of the item rects for the per-frame hover test.
+        self._item_boxes: dict[str, tuple[tuple[int, int, int, int], ...]] = {
+            "entity": (),
+            "environment": (),
+        }
         self.scroll: dict[str, int] = {"entity": 0, "environment": 0}
 
     def set_rects(
@@ -210,6 +265,10 @@ class PalettePanel(SectionPanel):
         self.environment_item_rects = self._build_palette_rects(
             self.environments_rect, len(self.registry.environments)
         )
+        self._item_boxes = {
+            "entity": tuple(tuple(r) for r in self.entity_item_rects),
+            "environment": tuple(tuple(r) for r in self.environment_item_rects),
+        }
 
     def clamp_scroll_states(self) -> None:
         entity_max = self._palette_max_scroll(
@@ -264,6 +323,7 @@ class PalettePanel(SectionPanel):
             self.scroll[kind] = scroll
         body_top, body_bottom = self.section_body_bounds(rect)
 
+        hovered_idx = hover_index(self._item_boxes[kind], mouse_pos, -scroll)
         count = min(len(items), len(item_rects))
         for i in range(count):
             item = items[i]
@@ -271,10 +331,9 @@ class PalettePanel(SectionPanel):
             r = base_rect.move(0, -scroll)
             if r.bottom < body_top or r.top > body_bottom:
                 continue
-            hovered = r.collidepoint(mouse_pos)
-            col = (55, 55, 55) if hovered else (45, 45, 45)
+            col = (55, 55, 55) if i == hovered_idx else (45, 45, 45)
             pygame.draw.rect(screen, col, r, border_radius=6)
-            t = self.font_mono.render(item.name, True, (220, 220, 220))
+            t = render_text(self.font_mono, item.name, (220, 220, 220))
             screen.blit(t, (r.x + 8, r.y + 6))
 
     def handle_scroll(self, pos: tuple[int, int], delta: float) -> bool:
@@ -430,7 +489,7 @@ class TreePanel(SectionPanel):
                 tag = " [Ent]" if node.kind == "entity" else " [Env]"
                 text = f"{node.name}{tag}"
             color = (255, 220, 160) if is_selected else (210, 210, 210)
-            t = self.font_mono.render(text, True, color)
+            t = render_text(self.font_mono, text, color)
             screen.blit(t, (text_x, y))
 
             self.hitboxes.append((line_rect.copy(), node.id))
@@ -474,6 +533,11 @@ class TreePanel(SectionPanel):
 
 
 class AttrsPanel(SectionPanel):
+    # type -> per-class (class, candidate attrs) in MRO order; see _class_attr_layout.
+    _attr_layouts: ClassVar[
+        dict[type, tuple[tuple[type, tuple[tuple[str, Any, bool], ...]], ...]]
+    ] = {}
+
     def __init__(
         self,
         font: pygame.font.Font,
@@ -643,8 +707,8 @@ class AttrsPanel(SectionPanel):
         return self.model.selected_label()
 
     def _draw_empty_inspector(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
-        msg = self.font_mono.render(
-            "No entities. Pick one from palette.", True, (160, 160, 160)
+        msg = render_text(
+            self.font_mono, "No entities. Pick one from palette.", (160, 160, 160)
         )
         screen.blit(msg, (rect.x + 10, rect.y + 40))
 
@@ -690,8 +754,8 @@ class AttrsPanel(SectionPanel):
                         post = self.input[self.cursor_pos :]
                         value_text = f"{pre}|{post}"
 
-                ksurf = self.font_mono.render(entry.label, True, key_color)
-                vsurf = self.font_mono.render(value_text, True, value_color)
+                ksurf = render_text(self.font_mono, entry.label, key_color)
+                vsurf = render_text(self.font_mono, value_text, value_color)
                 screen.blit(ksurf, (xk, y))
                 screen.blit(vsurf, (xv, y))
             y += self.attr_line_h
@@ -754,21 +818,11 @@ class AttrsPanel(SectionPanel):
 
         seen_attrs = set()
 
-        for cls in reversed(obj.__class__.__mro__):
-            if cls is object:
-                continue
-
+        for cls, candidates in self._class_attr_layout(obj.__class__):
             class_level_attrs: list[AttrEntry] = []
 
-            for k in sorted(cls.__dict__.keys()):
-                if k.startswith("_") or k in seen_attrs:
-                    continue
-
-                v = cls.__dict__[k]
-                is_property = isinstance(v, property)
-                is_data_like = not callable(v) or is_property
-
-                if not is_data_like:
+            for k, v, is_property in candidates:
+                if k in seen_attrs:
                     continue
 
                 try:
@@ -826,6 +880,36 @@ class AttrsPanel(SectionPanel):
 
         return items
 
+    @classmethod
+    def _class_attr_layout(
+        cls, obj_type: type
+    ) -> tuple[tuple[type, tuple[tuple[str, Any, bool], ...]], ...]:
+        """
+        Public data-like class attributes (name, descriptor, is_property) per
+        class of `obj_type`'s MRO, sorted by name. Values are still read live.
+        """
+        layout = cls._attr_layouts.get(obj_type)
+        if layout is not None:
+            return layout
+
+        per_class = []
+        for klass in reversed(obj_type.__mro__):
+            if klass is object:
+                continue
+            candidates = []
+            for k in sorted(klass.__dict__.keys()):
+                if k.startswith("_"):
+                    continue
+                v = klass.__dict__[k]
+                is_property = isinstance(v, property)
+                if callable(v) and not is_property:
+                    continue
+                candidates.append((k, v, is_property))
+            per_class.append((klass, tuple(candidates)))
+        layout = tuple(per_class)
+        cls._attr_layouts[obj_type] = layout
+        return layout
+
     def _vector_attr_entries(self, name: str, vec: pygame.Vector2) -> list[AttrEntry]:
         entries = [AttrEntry(name, self._safe_repr(vec))]
         for axis in ("x", "y"):
@@ -1060,7 +1144,7 @@ class ResolutionPanel(SectionPanel):
             label = label_map.get(key, key)
             if key == "custom" and self.editing:
                 label = self._format_edit_label(label)
-            surf = self.font_mono.render(label, True, (235, 235, 235))
+            surf = render_text(self.font_mono, label, (235, 235, 235))
             ty = r.y + (r.height - surf.get_height()) // 2
             screen.blit(surf, (r.x + 8, ty))
 
@@ -14,6 +14,11 @@ from game.scenes.editor import EditorScene
 from game.core.resources import get_config_path, get_composition_path
 
 
+# Background of the action/log panels. Their text layers are opaque surfaces
+# filled with it and keyed out, so text is pre-blended against the panel.
+PANEL_BG = (18, 18, 24)
+
+
 @dataclass
 class JoyInfo:
     idx: int
@@ -392,7 +397,7 @@ class InputTesterScene(Scene):
         if rect.width <= 0 or rect.height <= 0:
             return
 
-        pygame.draw.rect(screen, (18, 18, 24), rect, border_radius=12)
+        pygame.draw.rect(screen, PANEL_BG, rect, border_radius=12)
         pygame.draw.rect(screen, (40, 40, 60), rect, width=1, border_radius=12)
 
         if self._action_surface:
@@ -423,8 +428,7 @@ class InputTesterScene(Scene):
         self._action_content_height = content_h
 
         # Create surface
-        self._action_surface = pygame.Surface((width, content_h), pygame.SRCALPHA)
-        self._action_surface.fill((0, 0, 0, 0))
+        self._action_surface = self._panel_text_surface(width, content_h)
 
         # Render content
         title = self.small.render("Action Dictionary", True, (180, 180, 255))
@@ -483,7 +487,7 @@ class InputTesterScene(Scene):
         if rect.width <= 0 or rect.height <= 0:
             return
 
-        pygame.draw.rect(screen, (18, 18, 24), rect, border_radius=12)
+        pygame.draw.rect(screen, PANEL_BG, rect, border_radius=12)
         pygame.draw.rect(screen, (40, 40, 60), rect, width=1, border_radius=12)
 
         if self._log_surface:
@@ -493,6 +497,13 @@ class InputTesterScene(Scene):
                 (0, self._log_scroll_y, rect.width, rect.height),
             )
 
+    @staticmethod
+    def _panel_text_surface(width: int, height: int) -> pygame.Surface:
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill(PANEL_BG)
+        surface.set_colorkey(PANEL_BG)
+        return surface
+
     def _render_log_surface(self) -> None:
         if not self.small or not self._log_rect:
             return
@@ -503,8 +514,7 @@ class InputTesterScene(Scene):
         content_h += len(self.events) * (self.small.get_height() + line_gap)
         self._log_content_height = content_h
 
-        self._log_surface = pygame.Surface((width, content_h), pygame.SRCALPHA)
-        self._log_surface.fill((0, 0, 0, 0))
+        self._log_surface = self._panel_text_surface(width, content_h)
 
         title = self.small.render("Last events", True, (180, 180, 255))
         self._log_surface.blit(title, (14, 12))
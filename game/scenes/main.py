@@ -5,16 +5,33 @@ from pathlib import Path
 from time import perf_counter
 
 from game.compositions import CompositionRuntime, load_composition
+from game.entities.core.base import Entity
+from game.environments.base import Environment
+from game.entities.platforms import SpritePlatform
+from game.environments.void import VoidEnvironment
 from game.scenes.base import AppLike, Scene
 
 
 from game.core.resources import get_composition_path, get_config_path
 
 
+# Parsed once instead of on every fill().
+_CLEAR_COLOR = pygame.Color("white")
+
+# Classes whose adjacent nodes are drawn together (can_batch/batch_render).
+_BATCH_RENDERERS = (SpritePlatform, VoidEnvironment)
+
+
 class MainScene(Scene):
     def __init__(self, composition_path: str | Path | None = None) -> None:
         self.runtime: CompositionRuntime | None = None
         self._ordered_nodes: list = []
+        # Per-phase node lists, skipping instances that keep the base no-op hook
+        # (see _overrides_hook).
+        self._event_nodes: list = []
+        self._update_nodes: list = []
+        # (node, batch renderer class or None), resolved when the list is built.
+        self._render_nodes: list[tuple] = []
         self.composition_path: str | None = self._resolve_composition_path(
             composition_path
         )
@@ -61,10 +78,8 @@ class MainScene(Scene):
             app.cycle_resolution()
             return
 
-        for node in self._iter_runtime_nodes():
-            handler = getattr(node.instance, "handle_event", None)
-            if callable(handler):
-                handler(app, ev)
+        for node in self._event_nodes:
+            node.instance.handle_event(app, ev)
 
     # Add toggle and setter helpers
     def toggle_native_resolution(self) -> None:
@@ -81,7 +96,7 @@ class MainScene(Scene):
 
     # Update render to respect the flag
     def render(self, app: AppLike, screen: pygame.Surface) -> None:
-        screen.fill("white")
+        screen.fill(_CLEAR_COLOR)
         runtime = self.runtime
         if runtime is None:
             return
@@ -94,16 +109,27 @@ class MainScene(Scene):
             )
 
         render_surface = self._ensure_render_surface(target_size)
-        render_surface.fill("white")
+        render_surface.fill(_CLEAR_COLOR)
 
         self._node_render_times.clear()
-        for node in self._iter_runtime_nodes():
-            renderer = getattr(node.instance, "render", None)
-            if not callable(renderer):
+        # Consecutive sprite platforms / void markers are drawn with one blits()
+        # call per run; only adjacent nodes are grouped, so the draw order is
+        # unchanged.
+        batch: list = []
+        batch_cls = None
+        for node, renderer_cls in self._render_nodes:
+            if batch and renderer_cls is not batch_cls:
+                self._render_batch(batch_cls, batch, render_surface)
+                batch = []
+            if renderer_cls is not None:
+                batch_cls = renderer_cls
+                batch.append(node)
                 continue
             start = perf_counter()
-            renderer(app, render_surface)
+            node.instance.render(app, render_surface)
             self._node_render_times[node.id] = (perf_counter() - start) * 1000.0
+        if batch:
+            self._render_batch(batch_cls, batch, render_surface)
 
         canvas_rect = self._fit_canvas(screen.get_size(), render_surface.get_size())
         if canvas_rect.width <= 0 or canvas_rect.height <= 0:
@@ -125,12 +151,9 @@ class MainScene(Scene):
 
     def update(self, app: AppLike, dt: float) -> None:
         self._node_update_times.clear()
-        for node in self._iter_runtime_nodes():
-            updater = getattr(node.instance, "update", None)
-            if not callable(updater):
-                continue
+        for node in self._update_nodes:
             start = perf_counter()
-            updater(app, dt)
+            node.instance.update(app, dt)
             self._node_update_times[node.id] = (perf_counter() - start) * 1000.0
 
     # ---------- Composition helpers ----------
@@ -138,7 +161,7 @@ class MainScene(Scene):
     def _load_composition(self, app: AppLike) -> None:
         if self.composition_path is None:
             self.runtime = None
-            self._ordered_nodes = []
+            self._set_ordered_nodes([])
             self._render_surface = None
             self._render_surface_size = None
             self._node_update_times.clear()
@@ -151,7 +174,7 @@ class MainScene(Scene):
         except FileNotFoundError:
             print(f"[MainScene] Composition not found: {self.composition_path}")
             self.runtime = None
-            self._ordered_nodes = []
+            self._set_ordered_nodes([])
             self._render_surface = None
             self._render_surface_size = None
             self._node_update_times.clear()
@@ -159,7 +182,7 @@ class MainScene(Scene):
             self._scaled_surface = None
             return
 
-        self._ordered_nodes = list(self.runtime.iter_nodes())
+        self._set_ordered_nodes(list(self.runtime.iter_nodes()))
         self._node_update_times.clear()
         self._node_render_times.clear()
         self._scaled_surface = None
@@ -175,7 +198,7 @@ class MainScene(Scene):
             on_despawn = getattr(node.instance, "on_despawn", None)
             if callable(on_despawn):
                 on_despawn(app)
-        self._ordered_nodes = []
+        self._set_ordered_nodes([])
         self.runtime = None
         self._render_surface = None
         self._render_surface_size = None
@@ -183,8 +206,49 @@ class MainScene(Scene):
         self._node_render_times.clear()
         self._scaled_surface = None
 
-    def _iter_runtime_nodes(self):
-        return self._ordered_nodes
+    def _set_ordered_nodes(self, nodes: list) -> None:
+        self._ordered_nodes = nodes
+        self._event_nodes = self._phase_nodes("handle_event")
+        self._update_nodes = self._phase_nodes("update")
+        # Batchability is fixed per load: compositions are rebuilt on scene entry.
+        self._render_nodes = [
+            (node, self._batch_renderer(node.instance))
+            for node in self._phase_nodes("render")
+        ]
+
+    def _phase_nodes(self, method: str) -> list:
+        return [
+            node
+            for node in self._ordered_nodes
+            if self._overrides_hook(node.instance, method)
+        ]
+
+    @staticmethod
+    def _overrides_hook(instance: object, method: str) -> bool:
+        """False when `method` is missing or still the Entity/Environment no-op."""
+        if method in getattr(instance, "__dict__", {}):
+            return callable(instance.__dict__[method])
+        impl = getattr(type(instance), method, None)
+        if not callable(impl):
+            return False
+        return impl is not getattr(Entity, method) and impl is not getattr(
+            Environment, method
+        )
+
+    @staticmethod
+    def _batch_renderer(instance: object):
+        for cls in _BATCH_RENDERERS:
+            if cls.can_batch(instance):
+                return cls
+        return None
+
+    def _render_batch(self, renderer_cls, nodes: list, surface: pygame.Surface) -> None:
+        start = perf_counter()
+        renderer_cls.batch_render([node.instance for node in nodes], surface)
+        # Split the batch time evenly so the HUD timing report keeps one row per node.
+        share = (perf_counter() - start) * 1000.0 / len(nodes)
+        for node in nodes:
+            self._node_render_times[node.id] = share
 
     def _ensure_render_surface(self, size: tuple[int, int]) -> pygame.Surface:
         w = max(1, int(size[0] or 0))